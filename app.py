@@ -0,0 +1,345 @@
+import argparse
+import contextlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+
+from flask import Flask, Response, jsonify, request, render_template, g, stream_with_context
+
+from main import load_graph, find_shortest_path, find_shortest_path_bidirectional, build_incoming_edges, \
+    create_priority_queue_manual, find_max_connection
+from longest_path import find_longest_path_bounded
+from author_tree import AuthorTree
+from path_cache import ShortestPathCache
+from ego_network import EgoNetwork
+from id_allocator import IdAllocator
+from incremental import GraphIngestor, append_delta, json_row
+from dataset_cache import append_ingested_rows
+
+LONGEST_PATH_DEFAULT_TIMEOUT = 5.0
+LONGEST_PATH_MAX_TIMEOUT = 30.0
+EGO_NETWORK_MAX_HOPS = 3
+MOST_CONNECTED_MAX_K = 100
+
+
+class LatencyMetrics:
+    """Uç nokta başına son isteklerin gecikmelerini (ms) tutar."""
+
+    def __init__(self, window=1000):
+        self.window = window
+        self.samples = defaultdict(lambda: deque(maxlen=self.window))
+        self.counts = defaultdict(int)
+        self.lock = threading.Lock()
+
+    def record(self, endpoint, milliseconds):
+        with self.lock:
+            self.samples[endpoint].append(milliseconds)
+            self.counts[endpoint] += 1
+
+    def summary(self):
+        with self.lock:
+            snapshot = {endpoint: sorted(samples) for endpoint, samples in self.samples.items()}
+            counts = dict(self.counts)
+        result = {}
+        for endpoint, samples in snapshot.items():
+            result[endpoint] = {
+                "count": counts[endpoint],
+                "mean_ms": round(sum(samples) / len(samples), 3),
+                "p50_ms": round(samples[len(samples) // 2], 3),
+                "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+                "max_ms": round(samples[-1], 3),
+            }
+        return result
+
+
+class GraphLock:
+    """
+    Okuyucu-yazıcı kilidi: sorgular grafı aynı anda okur, /api/ingest ise
+    okuyucuların bitmesini bekleyip grafı tek başına değiştirir. Bekleyen
+    bir yazıcı varken yeni okuyucu alınmaz.
+    """
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.readers = 0
+        self.writers = 0
+        self.writing = False
+
+    def acquire_read(self):
+        with self.condition:
+            while self.writing or self.writers:
+                self.condition.wait()
+            self.readers += 1
+
+    def release_read(self):
+        with self.condition:
+            self.readers -= 1
+            if not self.readers:
+                self.condition.notify_all()
+
+    @contextlib.contextmanager
+    def write(self):
+        with self.condition:
+            self.writers += 1
+            while self.writing or self.readers:
+                self.condition.wait()
+            self.writers -= 1
+            self.writing = True
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.writing = False
+                self.condition.notify_all()
+
+
+def distance_or_none(distance):
+    return None if distance == float('inf') else distance
+
+
+def create_app(authorGraph=None, data=None, dataset_path="data/dataset.xlsx",
+               id_file="data/generated_ids.json", snapshot_path="graph_snapshot.bin"):
+    """
+    Grafı bir kez kurar (ya da verileni kullanır) ve algoritmaları JSON uç
+    noktaları olarak sunar. Graf yalnızca /api/ingest ile değişir; sorgular
+    GraphLock'un okuma tarafını tutar, paylaşılan önbellek ayrıca kilitlenir.
+    /api/ingest, grafın kurulduğu veri (data) biliniyorsa çalışır; eklenen
+    satırlar veri setinin ek günlüğüne, delta anlık görüntünün günlüğüne yazılır.
+    """
+    if authorGraph is None:
+        authorGraph, data = load_graph(dataset_path, id_file)
+
+    app = Flask(__name__)
+    app.config["GRAPH"] = authorGraph
+    metrics = LatencyMetrics()
+    path_cache = ShortestPathCache(authorGraph)
+    cache_lock = threading.Lock()
+    incoming = build_incoming_edges(authorGraph)
+    graph_lock = GraphLock()
+    ingestors = []
+
+    def unknown_author(orcid):
+        return jsonify({"error": f"No such ORCID {orcid} exists in the graph."}), 404
+
+    @app.before_request
+    def start_timer():
+        g.started = time.perf_counter()
+        if request.endpoint != "ingest":
+            graph_lock.acquire_read()
+            g.reading = True
+
+    @app.teardown_request
+    def release_graph(error=None):
+        # Akan yanıtlarda istek bağlamı (ve okuma kilidi) akış bitince kapanır
+        if g.pop("reading", False):
+            graph_lock.release_read()
+
+    @app.after_request
+    def record_latency(response):
+        if request.endpoint is not None:
+            endpoint, started = request.endpoint, g.started
+            if response.is_streamed:
+                # Akan gövde after_request'ten sonra üretilir; süre akış bitince kaydedilir
+                response.call_on_close(
+                    lambda: metrics.record(endpoint, (time.perf_counter() - started) * 1000)
+                )
+            else:
+                milliseconds = (time.perf_counter() - started) * 1000
+                metrics.record(endpoint, milliseconds)
+                response.headers["X-Response-Time-ms"] = f"{milliseconds:.3f}"
+        # deneme.py'nin ürettiği sayfa dosyadan açıldığında da API'yi çağırabilsin
+        response.headers["Access-Control-Allow-Origin"] = "*"
+        return response
+
+    @app.route("/")
+    def index():
+        return render_template("index.html")
+
+    @app.route("/api/shortest-path")
+    def shortest_path():
+        start_id = request.args.get("start", "")
+        end_id = request.args.get("end", "")
+        mode = request.args.get("mode", "cache")
+        if start_id not in authorGraph.getNodes():
+            return unknown_author(start_id)
+        if end_id not in authorGraph.getNodes():
+            return unknown_author(end_id)
+
+        if mode == "bidirectional":
+            path, distance = find_shortest_path_bidirectional(authorGraph, start_id, end_id, incoming)
+        elif mode == "heap":
+            path, distance = find_shortest_path(authorGraph, start_id, end_id)
+        elif mode == "cache":
+            with cache_lock:
+                result = path_cache.lookup(start_id, end_id)
+            if result is None:
+                # Dijkstra kilit dışında çalışır; yalnızca ekleme kilitlenir
+                built = path_cache.build(start_id)
+                with cache_lock:
+                    path_cache.store(built)
+                result = path_cache.resolve(built, end_id)
+            path, distance = result
+        else:
+            return jsonify({"error": f"Unknown mode: {mode}"}), 400
+        return jsonify({"start": start_id, "end": end_id, "path": path, "distance": distance_or_none(distance)})
+
+    @app.route("/api/queue/<orcid>")
+    def collaborator_queue(orcid):
+        if orcid not in authorGraph.getNodes():
+            return unknown_author(orcid)
+        weight = request.args.get("weight", "papers")
+        if weight not in ("papers", "degree"):
+            return jsonify({"error": f"Unknown queue weight: {weight}"}), 400
+        events = []
+        priority_queue = create_priority_queue_manual(authorGraph, orcid, weight, events.append)
+        return jsonify({
+            "orcid": orcid,
+            "weight": weight,
+            "queue": [{"orcid": author_id, "weight": author_weight} for author_weight, author_id in priority_queue],
+            "events": [
+                {"action": action, "orcid": author_id, "weight": author_weight, "size": size}
+                for action, author_id, author_weight, size in events
+            ],
+        })
+
+    @app.route("/api/tree/<orcid>")
+    def author_tree(orcid):
+        if orcid not in authorGraph.getNodes():
+            return unknown_author(orcid)
+        priority_queue = create_priority_queue_manual(authorGraph, orcid)
+        tree = AuthorTree.from_queue(authorGraph, priority_queue)
+        delete_id = request.args.get("delete")
+        deleted = tree.delete(delete_id) if delete_id else False
+        return jsonify({
+            "orcid": orcid,
+            "deleted": delete_id if deleted else None,
+            "height": tree.height(),
+            "levels": [
+                {"level": level, "orcid": author_id, "name": name, "weight": weight}
+                for level, (weight, author_id), name in tree.level_order()
+            ],
+            "layout": tree.layout(),
+        })
+
+    @app.route("/api/papers/<orcid>")
+    def papers(orcid):
+        if orcid not in authorGraph.getNodes():
+            return unknown_author(orcid)
+        paper_list = list(authorGraph.getNodes()[orcid]["papers"])
+        return jsonify({
+            "orcid": orcid,
+            "name": authorGraph.getNodes()[orcid]["name"],
+            "count": len(paper_list),
+            "papers": paper_list,
+        })
+
+    @app.route("/api/degree/<orcid>")
+    def degree(orcid):
+        if orcid not in authorGraph.getNodes():
+            return unknown_author(orcid)
+        return jsonify({
+            "orcid": orcid,
+            "degree": authorGraph.getDegree(orcid),
+            "weighted_degree": authorGraph.weighted_degrees.get(orcid),
+        })
+
+    @app.route("/api/most-connected")
+    def most_connected():
+        k = request.args.get("k", type=int)
+        weighted = request.args.get("weighted", "false").lower() == "true"
+        if "k" in request.args and (k is None or k < 1):
+            return jsonify({"error": "k must be a positive integer."}), 400
+        if k is None:
+            orcid, connections = find_max_connection(authorGraph)
+            top = [(orcid, connections)] if orcid is not None else []
+        else:
+            top = authorGraph.topAuthors(min(k, MOST_CONNECTED_MAX_K), weighted)
+        return jsonify({
+            "weighted": weighted,
+            "authors": [
+                {"orcid": orcid, "name": authorGraph.getNodes()[orcid]["name"], "value": value}
+                for orcid, value in top
+            ],
+        })
+
+    @app.route("/api/longest-path/<orcid>")
+    def longest_path(orcid):
+        if orcid not in authorGraph.getNodes():
+            return unknown_author(orcid)
+        timeout = request.args.get("timeout", LONGEST_PATH_DEFAULT_TIMEOUT, type=float)
+        timeout = max(0.0, min(timeout, LONGEST_PATH_MAX_TIMEOUT))
+        result = find_longest_path_bounded(authorGraph, orcid, time_limit=timeout, beam_width=32)
+        return jsonify({
+            "orcid": orcid,
+            "path": result.path,
+            "length": len(result.path),
+            "optimal": result.optimal,
+            "expanded": result.expanded,
+            "elapsed_ms": round(result.elapsed * 1000, 3),
+        })
+
+    def ego_hops():
+        hops = request.args.get("hops", 2, type=int)
+        return max(1, min(hops, EGO_NETWORK_MAX_HOPS))
+
+    @app.route("/api/ego-network/<orcid>")
+    def ego_network(orcid):
+        if orcid not in authorGraph.getNodes():
+            return unknown_author(orcid)
+        ego = EgoNetwork.from_graph(authorGraph, orcid, ego_hops())
+        return jsonify({"orcid": orcid, "hops": ego.hops, "distances": ego.distances()})
+
+    @app.route("/api/ego-network/<orcid>/steps")
+    def ego_network_steps(orcid):
+        """Dijkstra adımlarını satır değişiklikleri olarak JSON Lines biçiminde akıtır."""
+        if orcid not in authorGraph.getNodes():
+            return unknown_author(orcid)
+        ego = EgoNetwork.from_graph(authorGraph, orcid, ego_hops())
+
+        def generate():
+            for delta in ego.steps():
+                yield json.dumps(delta, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+        return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+    @app.route("/api/ingest", methods=["POST"])
+    def ingest():
+        """Yeni veri satırlarını ({"rows": [...]} ya da liste) grafa ekler; deltayı döndürür."""
+        if data is None:
+            return jsonify({"error": "Ingest needs the dataset the graph was built from."}), 400
+        body = request.get_json(silent=True)
+        rows = body.get("rows") if isinstance(body, dict) else body
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            return jsonify({"error": "Request body must be a list of row objects."}), 400
+
+        with graph_lock.write():
+            if not ingestors:
+                ingestors.append(GraphIngestor(authorGraph, data, IdAllocator(id_file)))
+            ingestor = ingestors[0]
+            delta = ingestor.ingest(rows)
+            ingestor.allocator.save()
+            append_ingested_rows(dataset_path, [json_row(row) for row in rows])
+            if snapshot_path is not None and os.path.exists(snapshot_path):
+                append_delta(delta, snapshot_path + ".deltas.jsonl")
+            incoming.clear()
+            incoming.update(build_incoming_edges(authorGraph))
+        return jsonify(delta)
+
+    @app.route("/api/metrics")
+    def latency_metrics():
+        with cache_lock:
+            cache_stats = {"hits": path_cache.hits, "misses": path_cache.misses, "trees": len(path_cache.trees)}
+        return jsonify({"endpoints": metrics.summary(), "path_cache": cache_stats})
+
+    return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Yazar grafı sorgu servisi")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    args = parser.parse_args()
+
+    create_app().run(host=args.host, port=args.port, threaded=True)
@@ -0,0 +1,212 @@
+from collections import deque
+
+
+class AVLNode:
+    def __init__(self, key, value=None):
+        self.key = key
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1
+
+
+def _height(node):
+    return node.height if node else 0
+
+
+def _update(node):
+    node.height = 1 + max(_height(node.left), _height(node.right))
+
+
+def _rotate_right(node):
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node):
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+class AuthorTree:
+    """
+    Yazarları (makale sayısı, ORCID) anahtarıyla tutan AVL ağacı.
+    Sıralı kuyruktan O(n) sürede dengeli kurulur; ekleme ve silme O(log n)'dir,
+    bu yüzden çok sayıda işbirlikçide ağaç bağlı listeye dönüşmez.
+    """
+
+    def __init__(self):
+        self.root = None
+        self.keys = {}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, orcid):
+        return orcid in self.keys
+
+    @classmethod
+    def from_sorted(cls, items):
+        """items: anahtara göre artan sıralı (anahtar, değer) listesi."""
+        tree = cls()
+
+        def build(low, high):
+            if low > high:
+                return None
+            middle = (low + high) // 2
+            key, value = items[middle]
+            node = AVLNode(key, value)
+            node.left = build(low, middle - 1)
+            node.right = build(middle + 1, high)
+            _update(node)
+            return node
+
+        tree.root = build(0, len(items) - 1)
+        tree.keys = {key[1]: key for key, _ in items}
+        return tree
+
+    @classmethod
+    def from_queue(cls, graph, priority_queue):
+        """
+        create_priority_queue_manual çıktısından (ağırlık, orcid) ağaç kurar.
+        Kuyruk ağırlığa göre azalan sırada olduğundan ters çevrilir; yalnızca
+        eşit ağırlıklı ardışık gruplar kendi içinde ORCID'e göre dizilir ve
+        liste from_sorted'a verilir. Sıralı olmayan kuyrukta ValueError yükselir.
+        """
+        nodes = graph.getNodes()
+        items = []
+        run = []
+        for weight, orcid in reversed(priority_queue):
+            if run and weight != run[0][0][0]:
+                if weight < run[0][0][0]:
+                    raise ValueError("priority_queue must be ordered by non-increasing weight.")
+                run.sort()
+                items.extend(run)
+                run = []
+            run.append(((weight, orcid), nodes[orcid]["name"]))
+        run.sort()
+        items.extend(run)
+        return cls.from_sorted(items)
+
+    def insert(self, key, value=None):
+        if key[1] in self.keys and self.keys[key[1]] != key:
+            self.delete(key[1])
+
+        def insert_at(node):
+            if node is None:
+                return AVLNode(key, value)
+            if key < node.key:
+                node.left = insert_at(node.left)
+            elif key > node.key:
+                node.right = insert_at(node.right)
+            else:
+                node.value = value
+                return node
+            return _rebalance(node)
+
+        self.root = insert_at(self.root)
+        self.keys[key[1]] = key
+
+    def delete(self, orcid):
+        """ORCID'i verilen yazarı ağaçtan siler; bulunamazsa False döner."""
+        key = self.keys.pop(orcid, None)
+        if key is None:
+            return False
+
+        def delete_at(node, key):
+            if node is None:
+                return None
+            if key < node.key:
+                node.left = delete_at(node.left, key)
+            elif key > node.key:
+                node.right = delete_at(node.right, key)
+            else:
+                if node.left is None:
+                    return node.right
+                if node.right is None:
+                    return node.left
+                successor = node.right
+                while successor.left is not None:
+                    successor = successor.left
+                node.key, node.value = successor.key, successor.value
+                node.right = delete_at(node.right, successor.key)
+            return _rebalance(node)
+
+        self.root = delete_at(self.root, key)
+        return True
+
+    def inorder(self):
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key, node.value
+            node = node.right
+
+    def level_order(self):
+        """(seviye, anahtar, değer) üçlülerini kökten başlayarak üretir."""
+        if self.root is None:
+            return
+        queue = deque([(0, self.root)])
+        while queue:
+            level, node = queue.popleft()
+            yield level, node.key, node.value
+            for child in (node.left, node.right):
+                if child is not None:
+                    queue.append((level + 1, child))
+
+    def height(self):
+        return _height(self.root)
+
+    def layout(self, x_spacing=120, y_spacing=100):
+        """
+        Görselleştirici için sabit konumlu düğüm/kenar listesi: x sıralı
+        (in-order) konumdan, y derinlikten hesaplanır.
+        """
+        nodes = []
+        edges = []
+        x_positions = {key[1]: i for i, (key, _) in enumerate(self.inorder())}
+        for level, key, value in self.level_order():
+            weight, orcid = key
+            nodes.append({
+                "id": orcid,
+                "label": value if value is not None else orcid,
+                "weight": weight,
+                "level": level,
+                "x": x_positions[orcid] * x_spacing,
+                "y": level * y_spacing,
+            })
+
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            for child in (node.left, node.right):
+                if child is not None:
+                    edges.append([node.key[1], child.key[1]])
+                    stack.append(child)
+        return {"nodes": nodes, "edges": edges}
@@ -0,0 +1,207 @@
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from graph_snapshot import load_snapshot
+from csr_graph import csr_find_shortest_path, csr_find_longest_path
+
+DEFAULT_TIMEOUT = 5.0
+
+# Her işçi süreç anlık görüntüyü bir kez mmap ile açar; Graph nesnesi
+# süreçler arasında hiç pickle'lanmaz, sayfalar işletim sistemi önbelleğinden
+# paylaşılır. Aramalar doğrudan bu tamsayı dizileri üzerinde çalışır.
+_worker = {}
+
+
+def parse_query(row):
+    """
+    Sorgu satırını çözer. Hatalı satır (nesne olmayan JSON, sayı olmayan ya da
+    pozitif olmayan timeout) toplu çalışmayı durdurmaz; sorguya "error" alanı
+    eklenir ve run_query onu hata satırı olarak raporlar.
+    """
+    if not isinstance(row, dict):
+        return {"kind": None, "start": None, "end": None, "error": "Query must be a JSON object."}
+    start = str(row.get("start") or "").strip().lower()
+    end = str(row.get("end") or "").strip().lower()
+    kind = str(row.get("kind") or ("shortest" if end else "longest")).strip().lower()
+    query = {"kind": kind, "start": start, "end": end or None}
+    if row.get("timeout") not in (None, ""):
+        try:
+            timeout = float(row["timeout"])
+        except (TypeError, ValueError):
+            timeout = math.nan
+        if math.isfinite(timeout) and timeout > 0:
+            query["timeout"] = timeout
+        else:
+            query["error"] = f"Invalid timeout: {row['timeout']!r}"
+    return query
+
+
+def read_queries(path):
+    """
+    Sorgu dosyasını okur. .csv dosyalarında başlık satırı, .jsonl dosyalarında
+    satır başına bir JSON nesnesi beklenir. Alanlar: kind (shortest|longest;
+    verilmezse end varsa shortest, yoksa longest), start, end, timeout (isteğe bağlı).
+    Çözülemeyen satırlar hata sorgusu olarak üretilir (bkz. parse_query).
+    """
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        if path.endswith(".csv"):
+            for row in csv.DictReader(file):
+                yield parse_query(row)
+            return
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                yield {"kind": None, "start": None, "end": None, "error": "Malformed JSON line."}
+                continue
+            yield parse_query(row)
+
+
+def run_query(query, snapshot, timeout=DEFAULT_TIMEOUT):
+    """
+    Tek sorguyu çalıştırır. Süre sınırı işbirlikçidir: sorgu işçide
+    başladığı andan itibaren ölçülür; en uzun yol aramasında o ana kadarki
+    en iyi yol "timeout" durumuyla döner. Sorgudaki beklenmeyen bir hata
+    yalnızca o sorgunun "error" satırına dönüşür, topluyu durdurmaz.
+    """
+    started = time.perf_counter()
+    time_limit = query.get("timeout", timeout)
+    result = {"kind": query["kind"], "start": query["start"], "end": query.get("end")}
+
+    try:
+        missing = [orcid for orcid in (query["start"], query.get("end")) if orcid is not None and orcid not in snapshot]
+        if query.get("error"):
+            result.update(status="error", error=query["error"])
+        elif query["kind"] not in ("shortest", "longest"):
+            result.update(status="error", error=f"Unknown query kind: {query['kind']}")
+        elif missing:
+            result.update(status="error", error=f"No such ORCID {missing[0]} exists in the graph.")
+        elif query["kind"] == "shortest":
+            if query.get("end") is None:
+                result.update(status="error", error="Shortest path queries need an end ORCID.")
+            else:
+                path, distance = csr_find_shortest_path(
+                    snapshot, query["start"], query["end"], started + time_limit
+                )
+                result.update(status="ok", path=path, distance=None if path is None else distance)
+        else:
+            longest = csr_find_longest_path(snapshot, query["start"], time_limit=time_limit, beam_width=32)
+            result.update(
+                status="ok" if longest.optimal else "timeout",
+                path=longest.path, length=len(longest.path), optimal=longest.optimal
+            )
+    except TimeoutError as error:
+        result.update(status="timeout", error=str(error))
+    except Exception as error:
+        result.update(status="error", error=f"{type(error).__name__}: {error}")
+
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return result
+
+
+def _init_worker(snapshot_path):
+    _worker["snapshot"] = load_snapshot(snapshot_path)
+
+
+def _run_chunk(chunk, timeout):
+    return [run_query(query, _worker["snapshot"], timeout) for query in chunk]
+
+
+def _chunks(queries, chunk_size):
+    chunk = []
+    for query in queries:
+        chunk.append(query)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _chunk_results(chunk, future):
+    """Parçanın sonuçları; işçi süreç çökerse parçadaki her sorgu hata satırı olur."""
+    try:
+        return future.result()
+    except Exception as error:
+        return [
+            {"kind": query["kind"], "start": query["start"], "end": query.get("end"),
+             "status": "error", "error": f"{type(error).__name__}: {error}"}
+            for query in chunk
+        ]
+
+
+def run_batch(queries, snapshot_path="graph_snapshot.bin", workers=None, timeout=DEFAULT_TIMEOUT, chunk_size=32):
+    """
+    Sorguları süreç havuzuna dağıtır ve sonuçları girdi sırasıyla, hazır
+    oldukça üretir. Sorgular chunk_size'lık parçalar halinde gönderilir; aynı
+    anda en fazla işçi sayısının iki katı parça bekler, böylece büyük
+    dosyalar belleğe tümüyle alınmaz. workers=1 havuz kurmadan aynı süreçte çalışır.
+    """
+    workers = workers or os.cpu_count() or 1
+    index = 0
+    if workers == 1:
+        _init_worker(snapshot_path)
+        for query in queries:
+            yield dict(index=index, **_run_chunk([query], timeout)[0])
+            index += 1
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(snapshot_path,)) as executor:
+        pending = deque()
+        for chunk in _chunks(queries, chunk_size):
+            pending.append((chunk, executor.submit(_run_chunk, chunk, timeout)))
+            while len(pending) >= workers * 2:
+                for result in _chunk_results(*pending.popleft()):
+                    yield dict(index=index, **result)
+                    index += 1
+        while pending:
+            for result in _chunk_results(*pending.popleft()):
+                yield dict(index=index, **result)
+                index += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CSV/JSONL dosyasındaki yol sorgularını paralel çalıştırır")
+    parser.add_argument("queries", help="Sorgu dosyası (.csv ya da .jsonl)")
+    parser.add_argument("--snapshot", default="graph_snapshot.bin")
+    parser.add_argument("--output", help="Sonuç dosyası (JSON Lines); verilmezse standart çıktı")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Sorgu başına süre sınırı (saniye)")
+    parser.add_argument("--chunk-size", type=int, default=32)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.snapshot):
+        from main import load_graph
+        from graph_snapshot import write_snapshot
+        authorGraph, _ = load_graph()
+        write_snapshot(authorGraph, args.snapshot)
+    else:
+        # incremental ile eklenen, henüz işlenmemiş deltalar önce anlık görüntüye yazılır
+        from incremental import apply_deltas_to_snapshot
+        apply_deltas_to_snapshot(args.snapshot)
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    started = time.perf_counter()
+    count = 0
+    try:
+        for result in run_batch(read_queries(args.queries), args.snapshot, args.workers, args.timeout, args.chunk_size):
+            output.write(json.dumps(result, ensure_ascii=False, separators=(",", ":")) + "\n")
+            output.flush()
+            count += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print(f"{count} sorgu {time.perf_counter() - started:.2f} s içinde yanıtlandı", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+centrality.compute_centrality için tam ve örneklemeli modları, tek süreç ve
+süreç havuzuyla ölçer; örneklemeli sonucun en yüksek betweenness'a sahip
+yazarlarla ne kadar örtüştüğünü gösterir.
+
+Kullanım (depo kök dizininden):
+    python -m benchmarks.centrality [ornek_sayisi] [isci_sayisi]
+"""
+import os
+import sys
+
+from main import load_graph
+from centrality import compute_centrality, top_brokers
+
+
+def report_progress(done, total):
+    print(f"\r  {done}/{total} kaynak", end="", file=sys.stderr)
+    if done == total:
+        print(file=sys.stderr)
+
+
+if __name__ == "__main__":
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    authorGraph, _ = load_graph()
+    print(f"Düğüm: {len(authorGraph.nodes)}, Kenar: {len(authorGraph.edges)}")
+
+    exact = compute_centrality(authorGraph, progress=report_progress)
+    print(f"Tam (1 süreç)        : {exact.elapsed * 1000:.1f} ms ({exact.sources} kaynak)")
+
+    if workers > 1:
+        parallel = compute_centrality(authorGraph, workers=workers, progress=report_progress)
+        assert all(
+            abs(parallel.betweenness[orcid] - value) < 1e-9 for orcid, value in exact.betweenness.items()
+        ), "süreç havuzu farklı sonuç verdi"
+        print(f"Tam ({workers} süreç)        : {parallel.elapsed * 1000:.1f} ms "
+              f"(hızlanma {exact.elapsed / parallel.elapsed:.1f}x)")
+
+    sampled = compute_centrality(authorGraph, samples=samples)
+    exact_top = [orcid for orcid, _ in top_brokers(exact, 20)]
+    sampled_top = [orcid for orcid, _ in top_brokers(sampled, 20)]
+    print(f"Örneklemeli ({samples})   : {sampled.elapsed * 1000:.1f} ms, "
+          f"ilk 20 yazarın {len(set(exact_top) & set(sampled_top))} tanesi aynı")
+
+    print("\nEn yüksek betweenness:")
+    for orcid, value in top_brokers(exact, 5):
+        print(f"  {authorGraph.getNodes()[orcid]['name']} ({orcid}): {value:.4f}, "
+              f"closeness {exact.closeness[orcid]:.4f}, bağlantı {authorGraph.getDegree(orcid)}")
@@ -0,0 +1,86 @@
+"""
+main.build_graph ile eski iterrows tabanlı kurulumu karşılaştırır.
+Her iki yol da aynı grafı üretmeli; süreler veri setinin farklı
+boyutları için ölçülür.
+
+Kullanım (depo kök dizininden):
+    python -m benchmarks.graph_build
+"""
+import time
+
+import pandas as pd
+
+from id_allocator import IdAllocator
+from main import Graph, build_graph, clean_connections, parse_coauthors
+
+
+def build_graph_iterrows(data, allocator):
+    # main.py'deki önceki kurulum (kimlikler aynı IdAllocator düzeniyle verilir)
+    author_papers = {}
+    for _, row in data.iterrows():
+        if pd.notna(row["orcid"]) and pd.notna(row["paper_title"]):
+            orcid = row["orcid"].lower()
+            if orcid not in author_papers:
+                author_papers[orcid] = []
+            if row["paper_title"] not in author_papers[orcid]:
+                author_papers[orcid].append(row["paper_title"])
+    unique_authors = data[["author_name", "orcid", "paper_title"]].dropna().drop_duplicates()
+    author_id_map = {row.orcid.lower(): row.author_name.lower() for _, row in unique_authors.iterrows()}
+
+    all_coauthors = set()
+    for coauthor_list in data["coauthors"].apply(parse_coauthors):
+        all_coauthors.update(coauthor_list)
+
+    existing_authors = set(author_id_map.values())
+    missing_coauthors = all_coauthors - existing_authors
+
+    for coauthor in sorted(missing_coauthors):
+        author_id_map[allocator.allocate(coauthor)] = coauthor
+
+    authorGraph = Graph()
+    for orcid, author_name in author_id_map.items():
+        authorGraph.addNode(orcid, author_name)
+        if orcid in author_papers:
+            for paper in author_papers[orcid]:
+                authorGraph.addPaper(orcid, paper)
+
+    data["author_orcid"] = data["orcid"].str.lower()
+    data["coauthors"] = data["coauthors"].apply(parse_coauthors)
+
+    for _, row in data.iterrows():
+        coauthors = row["coauthors"]
+        for coauthor in coauthors:
+            coauthor_orcid = next((k for k, v in author_id_map.items() if v == coauthor), None)
+            if coauthor_orcid:
+                authorGraph.addEdges(row["author_orcid"], coauthor_orcid)
+
+    clean_connections(authorGraph, data)
+    return authorGraph
+
+
+def same_graph(graph_a, graph_b):
+    return (
+        list(graph_a.nodes.items()) == list(graph_b.nodes.items())
+        and list(graph_a.edges.items()) == list(graph_b.edges.items())
+    )
+
+
+if __name__ == "__main__":
+    source = pd.read_excel('data/dataset.xlsx')
+
+    for fraction in (0.25, 0.5, 1.0):
+        data = source.iloc[:int(len(source) * fraction)]
+
+        started = time.perf_counter()
+        old_graph = build_graph_iterrows(data.copy(), IdAllocator())
+        old_time = time.perf_counter() - started
+
+        timings = {}
+        new_graph = build_graph(data.copy(), timings, IdAllocator())
+
+        assert same_graph(old_graph, new_graph), "iki kurulum farklı graf üretti"
+        phases = ", ".join(f"{phase}: {seconds * 1000:.1f} ms" for phase, seconds in timings.items() if phase != "total")
+        print(f"{len(data)} satır -> {len(new_graph.nodes)} düğüm, {len(new_graph.edges)} kenar")
+        print(f"  iterrows   : {old_time * 1000:.1f} ms")
+        print(f"  vektörel   : {timings['total'] * 1000:.1f} ms ({phases})")
+        print(f"  hızlanma   : {old_time / timings['total']:.1f}x")
@@ -0,0 +1,99 @@
+"""
+find_shortest_path için eski O(V^2) Dijkstra ile yığın tabanlı ve çift yönlü
+sürümleri karşılaştırır.
+
+Kullanım (depo kök dizininden):
+    python -m benchmarks.shortest_path [sorgu_sayisi]
+"""
+import random
+import sys
+import time
+
+from main import load_graph, dijkstra, find_shortest_path, find_shortest_path_bidirectional, build_incoming_edges
+
+
+def dijkstra_linear_scan(graph, start_node):
+    # main.py'deki önceki sürüm: her adımda en küçük düğüm listede aranır
+    unvisited_nodes = list(graph.getNodes().keys())
+    shortest_path = {}
+    previous_nodes = {}
+    max_value = sys.maxsize
+
+    for node in unvisited_nodes:
+        shortest_path[node] = max_value
+    shortest_path[start_node] = 0
+
+    while unvisited_nodes:
+        current_min_node = None
+        for node in unvisited_nodes:
+            if current_min_node is None or shortest_path[node] < shortest_path[current_min_node]:
+                current_min_node = node
+
+        for neighbor in graph.get_outgoing_edges(current_min_node):
+            temp_value = shortest_path[current_min_node] + graph.value(current_min_node, neighbor)
+            if temp_value < shortest_path[neighbor]:
+                shortest_path[neighbor] = temp_value
+                previous_nodes[neighbor] = current_min_node
+
+        unvisited_nodes.remove(current_min_node)
+
+    return previous_nodes, shortest_path
+
+
+def find_shortest_path_linear_scan(graph, start_id, end_id):
+    previous_nodes, shortest_path = dijkstra_linear_scan(graph, start_id)
+    path = []
+    current_node = end_id
+    while current_node != start_id:
+        path.append(current_node)
+        current_node = previous_nodes.get(current_node)
+        if current_node is None:
+            return None, float('inf')
+    path.append(start_id)
+    path.reverse()
+    return path, shortest_path[end_id]
+
+
+def run(graph, queries, engine):
+    results = []
+    started = time.perf_counter()
+    for start_id, end_id in queries:
+        results.append(engine(graph, start_id, end_id))
+    return results, time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    query_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    authorGraph, _ = load_graph()
+    print(f"Düğüm: {len(authorGraph.nodes)}, Kenar: {len(authorGraph.edges)}")
+
+    rng = random.Random(42)
+    orcids = [orcid for orcid in authorGraph.nodes if not orcid.startswith("generated")]
+    queries = []
+    for i in range(query_count):
+        start_id = rng.choice(orcids)
+        if i % 2 == 0:
+            # Sorguların yarısı aynı bileşen içinden seçilir
+            _, reachable_nodes = dijkstra(authorGraph, start_id)
+            end_id = rng.choice(sorted(reachable_nodes))
+        else:
+            end_id = rng.choice(orcids)
+        queries.append((start_id, end_id))
+
+    old_results, old_time = run(authorGraph, queries, find_shortest_path_linear_scan)
+    new_results, new_time = run(authorGraph, queries, find_shortest_path)
+    incoming = build_incoming_edges(authorGraph)
+    bi_results, bi_time = run(
+        authorGraph, queries,
+        lambda graph, start_id, end_id: find_shortest_path_bidirectional(graph, start_id, end_id, incoming)
+    )
+
+    for (_, old_distance), (_, new_distance), (_, bi_distance) in zip(old_results, new_results, bi_results):
+        assert old_distance == new_distance == bi_distance, "motorlar farklı mesafe buldu"
+
+    reachable = sum(1 for path, _ in new_results if path is not None)
+    print(f"{query_count} sorgu ({reachable} tanesi bağlantılı)")
+    print(f"Doğrusal tarama: {old_time * 1000:.1f} ms ({old_time / query_count * 1000:.2f} ms/sorgu)")
+    print(f"İkili yığın    : {new_time * 1000:.1f} ms ({new_time / query_count * 1000:.2f} ms/sorgu)")
+    print(f"Çift yönlü     : {bi_time * 1000:.1f} ms ({bi_time / query_count * 1000:.2f} ms/sorgu)")
+    print(f"Hızlanma       : {old_time / new_time:.1f}x (yığın), {old_time / bi_time:.1f}x (çift yönlü)")
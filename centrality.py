@@ -0,0 +1,176 @@
+import heapq
+import os
+import random
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+CentralityResult = namedtuple("CentralityResult", ["betweenness", "closeness", "sources", "elapsed"])
+
+# İşçi süreçlerde kenar dizilerinden bir kez kurulan komşuluk listesi
+_worker = {}
+
+
+def edge_arrays(graph):
+    """
+    (orcids, edge_u, edge_v, edge_w): Graph.edges ya da GraphSnapshot kenar
+    dizileri, düğüm sırasına göre tamsayı indeksli numpy dizileri olarak.
+    """
+    if hasattr(graph, "edge_u"):
+        return list(graph.orcids), graph.edge_u, graph.edge_v, graph.edge_w
+    orcids = list(graph.getNodes().keys())
+    index = {orcid: i for i, orcid in enumerate(orcids)}
+    edge_u = np.fromiter((index[u] for u, _ in graph.edges), dtype=np.int32, count=len(graph.edges))
+    edge_v = np.fromiter((index[v] for _, v in graph.edges), dtype=np.int32, count=len(graph.edges))
+    edge_w = np.fromiter(graph.edges.values(), dtype=np.int32, count=len(graph.edges))
+    return orcids, edge_u, edge_v, edge_w
+
+
+def edge_adjacency(node_count, edge_u, edge_v, edge_w):
+    """Yönsüz, ağırlıklı komşuluk: adjacency[i] = [(komşu, ağırlık), ...]."""
+    adjacency = [[] for _ in range(node_count)]
+    for u, v, weight in zip(edge_u.tolist(), edge_v.tolist(), edge_w.tolist()):
+        adjacency[u].append((v, weight))
+        adjacency[v].append((u, weight))
+    return adjacency
+
+
+def brandes_source(adjacency, source, betweenness):
+    """
+    Brandes algoritmasının tek kaynak adımı: kaynaktan Dijkstra ile en kısa
+    yol sayıları (sigma) ve öncüller bulunur, ardından bağımlılıklar
+    uzaklığa göre tersten toplanarak betweenness dizisine eklenir.
+    Kaynaktan ulaşılan düğüm sayısı ve uzaklıklar toplamı (closeness için) döner.
+    """
+    distances = {source: 0}
+    sigma = {source: 1}
+    predecessors = {source: []}
+    order = []
+    settled = set()
+    heap = [(0, source)]
+
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if node in settled:
+            continue
+        settled.add(node)
+        order.append(node)
+        for neighbor, weight in adjacency[node]:
+            candidate = distance + weight
+            best = distances.get(neighbor)
+            if best is None or candidate < best:
+                distances[neighbor] = candidate
+                sigma[neighbor] = sigma[node]
+                predecessors[neighbor] = [node]
+                heapq.heappush(heap, (candidate, neighbor))
+            elif candidate == best and neighbor not in settled:
+                sigma[neighbor] += sigma[node]
+                predecessors[neighbor].append(node)
+
+    dependency = dict.fromkeys(order, 0.0)
+    for node in reversed(order):
+        coefficient = (1.0 + dependency[node]) / sigma[node]
+        for predecessor in predecessors[node]:
+            dependency[predecessor] += sigma[predecessor] * coefficient
+        if node != source:
+            betweenness[node] += dependency[node]
+
+    return len(order), sum(distances[node] for node in order)
+
+
+def closeness_value(reached, distance_sum, node_count):
+    """
+    Wasserman-Faust closeness: bağlantısız graflarda ulaşılan düğüm oranıyla
+    ölçeklenir, böylece küçük bileşenlerdeki düğümler şişirilmez.
+    """
+    if distance_sum == 0 or node_count <= 1:
+        return 0.0
+    return (reached - 1) / distance_sum * (reached - 1) / (node_count - 1)
+
+
+def _run_sources(adjacency, sources):
+    betweenness = np.zeros(len(adjacency), dtype=np.float64)
+    closeness = {}
+    for source in sources:
+        reached, distance_sum = brandes_source(adjacency, source, betweenness)
+        closeness[source] = closeness_value(reached, distance_sum, len(adjacency))
+    return betweenness, closeness
+
+
+def _init_worker(node_count, edge_u, edge_v, edge_w):
+    _worker["adjacency"] = edge_adjacency(node_count, edge_u, edge_v, edge_w)
+
+
+def _run_chunk(sources):
+    betweenness, closeness = _run_sources(_worker["adjacency"], sources)
+    return len(sources), betweenness, closeness
+
+
+def compute_centrality(graph, samples=None, workers=1, normalized=True, seed=0, chunk_size=64, progress=None):
+    """
+    Ağırlıklı işbirliği grafında (Graph.edges; ağırlık dijkstra'daki gibi
+    mesafe olarak kullanılır) betweenness ve closeness merkeziliği.
+
+    samples verilirse yalnızca rastgele seçilen o kadar kaynak işlenir:
+    betweenness n / samples ile ölçeklenmiş bir tahmindir, closeness ise
+    yalnızca seçilen kaynaklar için hesaplanır. workers > 1 ise kaynaklar
+    chunk_size'lık parçalar halinde süreçlere dağıtılır; işçilere Graph değil
+    yalnızca kenar dizileri bir kez gönderilir. progress(tamamlanan, toplam)
+    her parça bittiğinde çağrılır.
+    """
+    started = time.perf_counter()
+    orcids, edge_u, edge_v, edge_w = edge_arrays(graph)
+    node_count = len(orcids)
+
+    sources = list(range(node_count))
+    if samples is not None and samples < node_count:
+        sources = sorted(random.Random(seed).sample(sources, samples))
+    chunks = [sources[i:i + chunk_size] for i in range(0, len(sources), chunk_size)]
+
+    betweenness = np.zeros(node_count, dtype=np.float64)
+    closeness = {}
+    done = 0
+    if workers == 1:
+        adjacency = edge_adjacency(node_count, edge_u, edge_v, edge_w)
+        for chunk in chunks:
+            partial, partial_closeness = _run_sources(adjacency, chunk)
+            betweenness += partial
+            closeness.update(partial_closeness)
+            done += len(chunk)
+            if progress is not None:
+                progress(done, len(sources))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(), initializer=_init_worker,
+            initargs=(node_count, edge_u, edge_v, edge_w)
+        ) as executor:
+            futures = [executor.submit(_run_chunk, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                count, partial, partial_closeness = future.result()
+                betweenness += partial
+                closeness.update(partial_closeness)
+                done += count
+                if progress is not None:
+                    progress(done, len(sources))
+
+    # Yönsüz grafta her çift iki kez (iki uçtan) sayılır
+    betweenness /= 2.0
+    if len(sources) < node_count:
+        betweenness *= node_count / len(sources)
+    if normalized and node_count > 2:
+        betweenness *= 2.0 / ((node_count - 1) * (node_count - 2))
+
+    return CentralityResult(
+        {orcid: float(value) for orcid, value in zip(orcids, betweenness)},
+        {orcids[source]: value for source, value in sorted(closeness.items())},
+        len(sources),
+        time.perf_counter() - started,
+    )
+
+
+def top_brokers(result, k=10, measure="betweenness"):
+    """En yüksek merkeziliğe sahip k yazar (orcid, değer)."""
+    values = getattr(result, measure)
+    return sorted(values.items(), key=lambda item: item[1], reverse=True)[:k]
@@ -0,0 +1,73 @@
+class ComponentIndex:
+    """
+    Bağlı bileşenler için birleşim-bul (union-find) yapısı. Boyuta göre
+    birleştirme ve yol yarılama ile find/connected amortize O(α(n)) çalışır.
+    Her kök kendi bileşeninin üye listesini tutar; birleşmede küçük liste
+    büyüğe eklenir, böylece listeler toplamda O(n log n) işle güncel kalır.
+
+    Bileşenler kenarlardan (Graph.edges) hesaplanır. clean_connections bir
+    bağlantıyı yalnızca bir taraftan sildiği için gerçek ulaşılabilirlik
+    bileşenden küçük olabilir: farklı bileşen "yol yok" demektir, aynı
+    bileşen ise yalnızca yol olabileceğini gösterir.
+    """
+
+    def __init__(self):
+        self.parent = {}
+        self.members = {}
+
+    def __contains__(self, key):
+        return key in self.parent
+
+    def __len__(self):
+        """Bileşen sayısı."""
+        return len(self.members)
+
+    def add(self, key):
+        if key not in self.parent:
+            self.parent[key] = key
+            self.members[key] = [key]
+
+    def find(self, key):
+        parent = self.parent
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    def union(self, key_1, key_2):
+        root_1 = self.find(key_1)
+        root_2 = self.find(key_2)
+        if root_1 == root_2:
+            return root_1
+        if len(self.members[root_1]) < len(self.members[root_2]):
+            root_1, root_2 = root_2, root_1
+        self.parent[root_2] = root_1
+        self.members[root_1].extend(self.members.pop(root_2))
+        return root_1
+
+    def connected(self, key_1, key_2):
+        """Bilinmeyen anahtarlar için False döner."""
+        if key_1 not in self.parent or key_2 not in self.parent:
+            return False
+        return self.find(key_1) == self.find(key_2)
+
+    def component(self, key):
+        """Bileşen kimliği: bileşenin kök anahtarı (birleşmelerle değişebilir)."""
+        return self.find(key) if key in self.parent else None
+
+    def size(self, key):
+        if key not in self.parent:
+            return 0
+        return len(self.members[self.find(key)])
+
+    def component_members(self, key):
+        if key not in self.parent:
+            return []
+        return list(self.members[self.find(key)])
+
+    def components(self):
+        """(kök, üye listesi) çiftleri, büyükten küçüğe."""
+        return sorted(
+            ((root, list(members)) for root, members in self.members.items()),
+            key=lambda component: len(component[1]), reverse=True
+        )
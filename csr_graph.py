@@ -0,0 +1,210 @@
+import heapq
+import time
+
+import numpy as np
+
+from component_index import ComponentIndex
+from longest_path import DEFAULT_TIME_LIMIT, LongestPathResult, find_longest_path_bounded
+
+
+class CSRGraph:
+    """
+    Graph nesnesinin salt okunur, sıkıştırılmış satır (CSR) biçimindeki kopyası.
+    Düğümler 0..n-1 tamsayılarıyla temsil edilir; i. düğümün komşuları
+    indices[indptr[i]:indptr[i + 1]] aralığında, kenar ağırlıkları da aynı
+    aralıkta weights dizisinde tutulur. orcids/index tablosu tamsayı <-> ORCID
+    dönüşümünü yapar.
+    """
+
+    def __init__(self, orcids, names, indptr, indices, weights, paper_counts):
+        self.orcids = list(orcids)
+        self.names = list(names)
+        self.index = {orcid: i for i, orcid in enumerate(self.orcids)}
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.paper_counts = paper_counts
+        for array in (self.indptr, self.indices, self.weights, self.paper_counts):
+            array.setflags(write=False)
+        self._components = None
+
+    @classmethod
+    def from_graph(cls, graph):
+        nodes = graph.getNodes()
+        orcids = list(nodes.keys())
+        index = {orcid: i for i, orcid in enumerate(orcids)}
+
+        capacity = sum(len(node_data["connections"]) for node_data in nodes.values())
+        indptr = np.zeros(len(orcids) + 1, dtype=np.int64)
+        indices = np.empty(capacity, dtype=np.int32)
+        weights = np.empty(capacity, dtype=np.int32)
+        position = 0
+        for node, (orcid, node_data) in enumerate(nodes.items()):
+            for conn in node_data["connections"]:
+                weight = graph.edges.get((min(orcid, conn), max(orcid, conn)))
+                if weight is None:
+                    # Kenarı olmayan bağlantı (liste dışarıdan değiştirilmiş) atlanır
+                    continue
+                indices[position] = index[conn]
+                weights[position] = weight
+                position += 1
+            indptr[node + 1] = position
+        if position < len(indices):
+            indices = indices[:position].copy()
+            weights = weights[:position].copy()
+
+        paper_counts = np.fromiter(
+            (len(node_data["papers"]) for node_data in nodes.values()),
+            dtype=np.int32, count=len(orcids)
+        )
+        names = [node_data["name"] for node_data in nodes.values()]
+        return cls(orcids, names, indptr, indices, weights, paper_counts)
+
+    def __len__(self):
+        return len(self.orcids)
+
+    def __contains__(self, orcid):
+        return orcid in self.index
+
+    @property
+    def nbytes(self):
+        """Tamsayı dizilerinin bellekte kapladığı toplam bayt."""
+        return self.indptr.nbytes + self.indices.nbytes + self.weights.nbytes + self.paper_counts.nbytes
+
+    def component_labels(self):
+        """
+        Düğüm başına bileşen etiketi (bağlantılar yönsüz kabul edilerek).
+        Farklı etiketli iki düğüm arasında yol yoktur; etiketler ilk çağrıda
+        birleşim-bul ile bir kez hesaplanır ve int32 dizisi olarak saklanır.
+        """
+        if self._components is None:
+            node_count = len(self.orcids)
+            components = ComponentIndex()
+            for node in range(node_count):
+                components.add(node)
+            sources = np.repeat(np.arange(node_count, dtype=np.int32), self.degrees())
+            for node, neighbor in zip(sources.tolist(), self.indices.tolist()):
+                components.union(node, neighbor)
+            labels = np.fromiter((components.find(node) for node in range(node_count)), dtype=np.int32, count=node_count)
+            labels.setflags(write=False)
+            self._components = labels
+        return self._components
+
+    def neighbors(self, node):
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    def neighbor_weights(self, node):
+        return self.weights[self.indptr[node]:self.indptr[node + 1]]
+
+    def degrees(self):
+        return np.diff(self.indptr)
+
+    def degree(self, orcid):
+        node = self.index.get(orcid)
+        if node is None:
+            return None
+        return int(self.indptr[node + 1] - self.indptr[node])
+
+
+def csr_dijkstra(csr, start_node, end_node=None, deadline=None):
+    """
+    main.dijkstra'nın CSR üzerindeki karşılığı; düğümler tamsayı indekstir.
+    main.dijkstra gibi yalnızca ulaşılan düğümleri içeren previous ve
+    distances sözlükleri döner, böylece erken çıkışlı bir sorgunun maliyeti
+    graf boyutuna bağlı kalmaz. deadline (time.perf_counter değeri) aşılırsa
+    TimeoutError yükselir.
+    """
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+
+    distances = {}
+    previous = {}
+    best = {start_node: 0}
+    heap = [(0, start_node)]
+
+    while heap:
+        current_distance, current_node = heapq.heappop(heap)
+        if current_node in distances:
+            continue
+        distances[current_node] = current_distance
+        if current_node == end_node:
+            break
+        if deadline is not None and len(distances) % 256 == 0 and time.perf_counter() > deadline:
+            raise TimeoutError("Shortest path search exceeded its time limit.")
+
+        # Yalnızca bu düğümün dilimi Python int'lerine çevrilir
+        begin, end = indptr[current_node], indptr[current_node + 1]
+        for neighbor, weight in zip(indices[begin:end].tolist(), weights[begin:end].tolist()):
+            if neighbor in distances:
+                continue
+            temp_value = current_distance + weight
+            if neighbor not in best or temp_value < best[neighbor]:
+                best[neighbor] = temp_value
+                previous[neighbor] = current_node
+                heapq.heappush(heap, (temp_value, neighbor))
+
+    return previous, distances
+
+
+def csr_find_shortest_path(csr, start_id, end_id, deadline=None):
+    """main.find_shortest_path ile aynı (path, distance) çiftini döndürür."""
+    if start_id not in csr or end_id not in csr:
+        return None, float('inf')
+    start_node = csr.index[start_id]
+    end_node = csr.index[end_id]
+    labels = csr.component_labels()
+    if labels[start_node] != labels[end_node]:
+        return None, float('inf')
+    previous, distances = csr_dijkstra(csr, start_node, end_node, deadline)
+    if end_node not in distances:
+        return None, float('inf')
+
+    path = []
+    current_node = end_node
+    while current_node != start_node:
+        path.append(csr.orcids[current_node])
+        current_node = previous[current_node]
+    path.append(start_id)
+    path.reverse()
+    return path, distances[end_node]
+
+
+def csr_find_max_connection(csr):
+    """En çok bağlantısı olan yazarı ve bağlantı sayısını döndürür."""
+    if len(csr) == 0:
+        return None, 0
+    degrees = csr.degrees()
+    node = int(np.argmax(degrees))
+    if degrees[node] == 0:
+        return None, 0
+    return csr.orcids[node], int(degrees[node])
+
+
+class CSRAdjacency:
+    """
+    CSRGraph'ı longest_path fonksiyonlarının beklediği Graph arayüzüyle
+    (getNodes, get_outgoing_edges) tamsayı düğümler üzerinde sunar. Komşular
+    istendikçe indices dizisinden dilimlenir; ORCID'lere yalnızca sonuç çevrilir.
+    """
+
+    def __init__(self, csr):
+        self.csr = csr
+
+    def getNodes(self):
+        return range(len(self.csr))
+
+    def get_outgoing_edges(self, node):
+        return self.csr.neighbors(node).tolist()
+
+
+def csr_find_longest_path(csr, start_id, time_limit=DEFAULT_TIME_LIMIT, node_budget=None, beam_width=32):
+    """
+    En uzun basit yol; arama longest_path.find_longest_path_bounded ile
+    tamsayı düğümler üzerinde, süre ve düğüm bütçesiyle yapılır. Yolu ORCID
+    listesi olan bir LongestPathResult döner.
+    """
+    if start_id not in csr:
+        return LongestPathResult([], True, 0, 0.0)
+    result = find_longest_path_bounded(
+        CSRAdjacency(csr), csr.index[start_id], time_limit, node_budget, beam_width
+    )
+    return result._replace(path=[csr.orcids[node] for node in result.path])
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+CACHE_VERSION = 1
+
+
+def cache_path_for(file_path):
+    return f"{file_path}.cache.npz"
+
+
+def file_digest(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_cache(data, cache_path, meta):
+    """
+    DataFrame'i sütun sütun .npz dosyasına yazar. Metin sütunları sabit
+    genişlikli unicode dizisi olarak saklanır; eksik hücreler ayrı bir
+    maske dizisinde tutulur, böylece dosya pickle olmadan okunabilir.
+    """
+    arrays = {}
+    columns = []
+    for column in data.columns:
+        series = data[column]
+        if pd.api.types.is_numeric_dtype(series):
+            arrays[f"col_{len(columns)}"] = series.to_numpy()
+            columns.append({"name": column, "kind": "numeric"})
+        else:
+            missing = series.isna().to_numpy()
+            values = series.where(~missing, "").astype(str).to_numpy(dtype=str)
+            arrays[f"col_{len(columns)}"] = values
+            arrays[f"na_{len(columns)}"] = missing
+            columns.append({"name": column, "kind": "text"})
+
+    meta = dict(meta, version=CACHE_VERSION, columns=columns)
+    arrays["meta"] = np.array(json.dumps(meta))
+    temp_path = f"{cache_path}.tmp.npz"
+    np.savez(temp_path, **arrays)
+    os.replace(temp_path, cache_path)
+
+
+def read_cache(cache_path):
+    with np.load(cache_path) as archive:
+        meta = json.loads(str(archive["meta"]))
+        if meta.get("version") != CACHE_VERSION:
+            return None, meta
+        columns = {}
+        for i, column in enumerate(meta["columns"]):
+            values = archive[f"col_{i}"]
+            if column["kind"] == "numeric":
+                columns[column["name"]] = values
+            else:
+                series = pd.Series(values.tolist())
+                columns[column["name"]] = series.mask(archive[f"na_{i}"])
+    return pd.DataFrame(columns), meta
+
+
+def read_dataset(file_path='data/dataset.xlsx', cache_path=None):
+    """
+    pd.read_excel yerine kullanılır. Excel dosyası ilk okumada .npz önbelleğine
+    dönüştürülür; sonraki açılışlarda dosyanın boyutu ve değişiklik zamanı
+    aynıysa önbellek doğrudan okunur. Bunlar değişmiş fakat içerik özeti
+    (sha256) aynıysa önbellek yine kullanılır, aksi halde yeniden oluşturulur.
+    """
+    if cache_path is None:
+        cache_path = cache_path_for(file_path)
+    stat = os.stat(file_path)
+
+    if os.path.exists(cache_path):
+        try:
+            data, meta = read_cache(cache_path)
+        except (OSError, ValueError, KeyError):
+            data, meta = None, {}
+        if data is not None:
+            if meta.get("mtime_ns") == stat.st_mtime_ns and meta.get("size") == stat.st_size:
+                return data
+            digest = file_digest(file_path)
+            if meta.get("sha256") == digest:
+                write_cache(data, cache_path, {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest})
+                return data
+
+    data = pd.read_excel(file_path)
+    write_cache(data, cache_path, {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": file_digest(file_path),
+    })
+    return data
+
+
+def ingested_rows_path(file_path):
+    return f"{file_path}.ingested.jsonl"
+
+
+def read_ingested_rows(file_path):
+    """incremental ile veri setine sonradan eklenen satırlar (DataFrame) ya da None."""
+    path = ingested_rows_path(file_path)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as file:
+        rows = [json.loads(line) for line in file if line.strip()]
+    return pd.DataFrame(rows) if rows else None
+
+
+def append_ingested_rows(file_path, rows):
+    """Satırları (JSON'a yazılabilir sözlükler) veri setinin ek günlüğüne yazar."""
+    with open(ingested_rows_path(file_path), "a", encoding="utf-8") as file:
+        for row in rows:
+            file.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")) + "\n")
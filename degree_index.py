@@ -0,0 +1,86 @@
+import bisect
+
+
+class DegreeIndex:
+    """
+    Düğüm -> derece eşlemesi ve aynı dereceli düğümleri tutan kovalar.
+    Tek bir düğümün derecesi O(1) okunur/güncellenir; en yüksek dereceli k düğüm
+    graf yeniden taranmadan ve sıralanmadan bulunur: dolu kova değerleri ve her
+    kovadaki düğümler güncelleme sırasında bisect ile sıralı tutulur. Eşitlikte
+    düğümün indekse eklenme sırası (Graph'taki düğüm sırası) korunur.
+    """
+
+    def __init__(self):
+        self.values = {}
+        self.order = {}
+        self.keys = []
+        # değer -> o değerdeki düğümlerin eklenme sıraları (artan, bisect ile korunur)
+        self.buckets = {}
+        # dolu kovaların değerleri, artan sırada
+        self.bucket_values = []
+
+    def __contains__(self, key):
+        return key in self.values
+
+    def __len__(self):
+        return len(self.values)
+
+    def _insert(self, key, value):
+        bucket = self.buckets.get(value)
+        if bucket is None:
+            bucket = self.buckets[value] = []
+            bisect.insort(self.bucket_values, value)
+        bisect.insort(bucket, self.order[key])
+
+    def _remove(self, key, value):
+        bucket = self.buckets[value]
+        del bucket[bisect.bisect_left(bucket, self.order[key])]
+        if not bucket:
+            del self.buckets[value]
+            del self.bucket_values[bisect.bisect_left(self.bucket_values, value)]
+
+    def add(self, key, value=0):
+        if key in self.values:
+            return
+        self.order[key] = len(self.keys)
+        self.keys.append(key)
+        self.values[key] = value
+        self._insert(key, value)
+
+    def remove(self, key):
+        if key not in self.values:
+            return
+        self._remove(key, self.values.pop(key))
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value):
+        if key not in self.values:
+            self.add(key, value)
+            return
+        old_value = self.values[key]
+        if old_value == value:
+            return
+        self._remove(key, old_value)
+        self.values[key] = value
+        self._insert(key, value)
+
+    def increment(self, key, delta=1):
+        self.set(key, self.values.get(key, 0) + delta)
+
+    def top(self, k=1):
+        """
+        En yüksek değerli k düğümü (düğüm, değer) listesi olarak döndürür.
+        Kovalar ve kova içleri sıralı tutulduğu için yalnızca okunan k düğüm
+        ve geçilen kovalar kadar iş yapılır.
+        """
+        result = []
+        if k <= 0:
+            return result
+        for value in reversed(self.bucket_values):
+            for position in self.buckets[value]:
+                result.append((self.keys[position], value))
+                if len(result) == k:
+                    return result
+        return result
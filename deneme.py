@@ -1,8 +1,31 @@
 import json
+import os
 from pyvis.network import Network
 
-def create_visualization(graph_data):
-    """JSON dosyasından okunan graf verisini görselleştirir"""
+from graph_snapshot import load_snapshot
+from graph_layout import cached_layout
+from incremental import apply_delta, read_deltas
+
+def read_graph_data(graph_data):
+    """writeJsonManual JSON dosyasını ya da ikili graf anlık görüntüsünü okur"""
+    if graph_data.endswith(".bin"):
+        data = load_snapshot(graph_data).to_graph_data()
+        # Anlık görüntüden sonra incremental.GraphIngestor ile eklenen satırlar
+        if os.path.exists(graph_data + ".deltas.jsonl"):
+            for delta in read_deltas(graph_data + ".deltas.jsonl"):
+                apply_delta(data, delta)
+        return data
+    with open(graph_data, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+def create_visualization(graph_data, api_base="http://127.0.0.1:5000", precomputed_layout=True):
+    """
+    JSON dosyasından okunan graf verisini görselleştirir.
+    İsterlerin algoritmaları sayfada değil, api_base adresindeki app.py servisinde çalışır.
+    precomputed_layout True ise düğüm konumları graph_layout ile Python'da
+    hesaplanır (graf dosyasının özetine göre önbelleklenir) ve sayfaya sabit
+    x/y olarak yazılır; tarayıcıda fizik simülasyonu çalışmaz.
+    """
     # Ağı oluştur
     net = Network(
         height="750px",
@@ -29,10 +52,12 @@ def create_visualization(graph_data):
         }
     }
     
+    data = read_graph_data(graph_data)
+    positions = cached_layout(data, graph_data) if precomputed_layout else {}
+    if positions:
+        options["physics"] = {"enabled": False}
+
     net.set_options(json.dumps(options))
-    
-    with open(graph_data, 'r', encoding='utf-8') as file:
-        data = json.load(file)
         
     paper_counts = [
     len(node.get("papers", [])) 
@@ -67,18 +92,22 @@ def create_visualization(graph_data):
                     color = "#00ff00"  
                     size = 40 
 
+            if node_id in positions:
+                x, y = positions[node_id]
+                placement = {"x": x, "y": y, "physics": False}
+            else:
+                placement = {}
+
             net.add_node(
                 node_id,
                 label=node["name"],
-                title=f"""
-                    <b>ORCID:</b> {node_id}<br>
-                    <b>İsim:</b> {node['name']}<br>
-                    <b>Makale Sayısı:</b> {paper_count}<br>
-                    <b>Makaleler:</b><br>{"<br>".join(node.get("papers", [])) if node.get("papers") else "Yok"}
-                """,
+                # Makale başlıkları sayfaya gömülmez; tıklanınca /api/papers/<orcid> ile alınır
+                title=f"ORCID: {node_id}\nİsim: {node['name']}\nMakale Sayısı: {paper_count}",
+                paperCount=paper_count,
                 color=color,
                 size=size,
-                mass=1 + paper_count * 0.1
+                mass=1 + paper_count * 0.1,
+                **placement
             )
             added_nodes.add(node_id)
 
@@ -91,6 +120,7 @@ def create_visualization(graph_data):
             net.add_edge(
                 source,
                 target,
+                id=f"{source}|{target}",
                 value=weight,
                 title=f"Bağlantı sayısı: {weight}",
                 width=1 + weight / 2
@@ -239,6 +269,42 @@ def create_visualization(graph_data):
 
 <script>
    let lastHighlightedNode = null;
+   let highlightedEdges = [];
+   const API_BASE = "__API_BASE__";
+
+// Graf algoritmaları Python servisinde (app.py) çalışır; sayfa yalnızca
+// sonucu çizer ve değişen düğüm/kenarları günceller.
+async function callApi(path) {
+    try {
+        const response = await fetch(API_BASE + path);
+        const result = await response.json();
+        if (!response.ok) {
+            alert(result.error || "Sunucu hatası!");
+            return null;
+        }
+        return result;
+    } catch (error) {
+        alert("Graf servisine ulaşılamadı: " + API_BASE);
+        return null;
+    }
+}
+
+function askOrcid(message) {
+    let authorId = prompt(message);
+    if (!authorId) {
+        alert("Geçersiz ORCID ID!");
+        return null;
+    }
+    if (!nodes.get(authorId)) {
+        alert("Bu ORCID ID'ye sahip bir yazar bulunamadı!");
+        return null;
+    }
+    return authorId;
+}
+
+function edgeId(source, target) {
+    return source < target ? source + "|" + target : target + "|" + source;
+}
 
 function handleClick(isterId) {
     if (isterId === 1) {
@@ -246,33 +312,7 @@ function handleClick(isterId) {
     } else if (isterId === 2) {
         handleCooperationQueue();
     } else if (isterId === 3) {
-        let authorId = prompt("Lütfen yazarın ORCID ID'sini giriniz:");
-        if (!authorId) {
-            alert("Geçersiz ORCID ID!");
-            return;
-        }
-
-        let foundAuthor = nodes.get(authorId);
-        if (!foundAuthor) {
-            alert("Bu ORCID ID'ye sahip bir yazar bulunamadı!");
-            return;
-        }
-
-        let connections = network.getConnectedNodes(authorId);
-        if (connections.length === 0) {
-            alert("Bu yazarın bağlantısı bulunmamaktadır!");
-            return;
-        }
-
-        let connectionNames = connections.map(id => nodes.get(id).label);
-        
-        let bstDisplay = document.getElementById("info-content");
-        bstDisplay.innerHTML = `
-            <h3>Bağlantı Ağacı</h3>
-            <pre style="color: white; font-family: monospace; line-height: 1.5; font-size: 12px;">
-${createTreeVisualization(connectionNames)}
-            </pre>
-        `;
+        handleAuthorTree();
     } else if (isterId === 4) {
         handleShortestPathsFromAuthor();
     } else if (isterId === 5) {
@@ -284,35 +324,29 @@ ${createTreeVisualization(connectionNames)}
     }
 }
 
-function createTreeVisualization(names) {
-    if (!names || names.length === 0) return "";
+async function handleAuthorTree() {
+    let authorId = askOrcid("Lütfen yazarın ORCID ID'sini giriniz:");
+    if (!authorId) return;
+    let deleteId = prompt("Ağaçtan silinecek yazarın ORCID ID'sini giriniz (boş bırakılabilir):") || "";
 
-    // Ağaç seviyelerini oluştur
-    let levels = [];
-    let currentLevel = 0;
-    let nodesInLevel = 1;
-    let currentIndex = 0;
-
-    while (currentIndex < names.length) {
-        let level = names.slice(currentIndex, currentIndex + nodesInLevel);
-        levels.push(level);
-        currentIndex += nodesInLevel;
-        nodesInLevel *= 2;
-    }
+    let result = await callApi(`/api/tree/${encodeURIComponent(authorId)}?delete=${encodeURIComponent(deleteId)}`);
+    if (!result) return;
 
-    let visualization = [];
-    levels.forEach((level, index) => {
-        // Her seviye için boşluk hesapla
-        let padding = " ".repeat(Math.max(0, (50 - level.join(" ").length) / 2));
-        visualization.push(padding + level.join("     "));
-        
-        if (index < levels.length - 1) {
-            let connections = level.map(() => "/   \\").join(" ");
-            visualization.push(padding + connections);
-        }
+    let levels = [];
+    result.levels.forEach(item => {
+        if (!levels[item.level]) levels[item.level] = [];
+        levels[item.level].push(`${item.name} (${item.weight})`);
     });
 
-    return visualization.join("\n");
+    let bstDisplay = document.getElementById("info-content");
+    bstDisplay.innerHTML = `
+        <h3>Bağlantı Ağacı</h3>
+        ${result.deleted ? `<p>Silinen: ${result.deleted}</p>` : ""}
+        <p>Yükseklik: ${result.height}</p>
+        <pre style="color: white; font-family: monospace; line-height: 1.5; font-size: 12px;">
+${levels.map((level, index) => `${index}: ${level.join("  ")}`).join("\n")}
+        </pre>
+    `;
 }
 
 function closeShortestPathsTable() {
@@ -321,209 +355,79 @@ function closeShortestPathsTable() {
     tableContainer.querySelector("tbody").innerHTML = ""; // Tablo içeriğini temizle
 }
 
+async function handleShortestPathsFromAuthor() {
+    let authorId = askOrcid("Lütfen A yazarının ORCID ID'sini giriniz:");
+    if (!authorId) return;
 
-    function handleShortestPathsFromAuthor() {
-    let authorId = prompt("Lütfen A yazarının ORCID ID'sini giriniz:");
-    if (!authorId) {
-        alert("Geçersiz ORCID ID!");
+    let response;
+    try {
+        response = await fetch(`${API_BASE}/api/ego-network/${encodeURIComponent(authorId)}/steps`);
+    } catch (error) {
+        alert("Graf servisine ulaşılamadı: " + API_BASE);
         return;
     }
-
-    let foundAuthor = nodes.get(authorId);
-    if (!foundAuthor) {
-        alert("Bu ORCID ID'ye sahip bir yazar bulunamadı!");
+    if (!response.ok) {
+        let result = await response.json();
+        alert(result.error || "Sunucu hatası!");
         return;
     }
 
-    let graph = {};
-    let queue = [authorId];
-    let visited = new Set();
-
-    while (queue.length > 0) {
-        let current = queue.shift();
-        if (visited.has(current)) continue;
+    document.getElementById("info-content").innerHTML =
+        `<p id="ego-step">Adım: 0</p><table><thead><tr><th>Düğüm</th><th>Adım</th><th>Mesafe</th><th>Önceki</th></tr></thead><tbody id="ego-table"></tbody></table>`;
+    const tableBody = document.getElementById("ego-table");
+    const stepLabel = document.getElementById("ego-step");
+    const rowElements = new Map();
 
-        visited.add(current);
-        let neighbors = network.getConnectedNodes(current);
-        graph[current] = [];
-
-        neighbors.forEach(neighbor => {
-            if (!visited.has(neighbor)) {
-                queue.push(neighbor);
-                graph[current].push({ id: neighbor, weight: edges.get(network.getConnectedEdges(current).find(edgeId => edges.get(edgeId).to === neighbor || edges.get(edgeId).from === neighbor)).value || 1 });
+    // Her satır bir kez oluşturulur; sonraki adımlarda yalnızca değişen satırlar güncellenir
+    function applyDelta(delta) {
+        delta.rows.forEach(row => {
+            let element = rowElements.get(row.orcid);
+            if (!element) {
+                element = tableBody.insertRow();
+                rowElements.set(row.orcid, element);
             }
+            element.innerHTML = `<td>${row.orcid}</td><td>${row.hop}</td><td>${row.distance === null ? "∞" : row.distance}</td><td>${row.previous || "-"}</td>`;
+            element.style.fontWeight = row.orcid === delta.settled ? "bold" : "normal";
         });
+        stepLabel.textContent = `Adım: ${delta.step}`;
     }
 
-    let distances = {};
-    let previous = {};
-    let unvisited = new Set(Object.keys(graph));
-    let tableContainer = document.getElementById("info-content");
-    tableContainer.innerHTML = "<table><tr><th>Düğüm</th><th>Mesafe</th><th>Önceki</th></tr></table>";
-
-    Object.keys(graph).forEach(node => {
-        distances[node] = Infinity;
-        previous[node] = null;
-    });
-    distances[authorId] = 0;
-
-    while (unvisited.size > 0) {
-        let currentNode = Array.from(unvisited).reduce((a, b) => distances[a] < distances[b] ? a : b);
-        unvisited.delete(currentNode);
-
-        graph[currentNode].forEach(neighbor => {
-            let newDist = distances[currentNode] + neighbor.weight;
-            if (newDist < distances[neighbor.id]) {
-                distances[neighbor.id] = newDist;
-                previous[neighbor.id] = currentNode;
-            }
-        });
-
-        let table = tableContainer.querySelector("table");
-        table.innerHTML = "<tr><th>Düğüm</th><th>Mesafe</th><th>Önceki</th></tr>";
-        Object.keys(distances).forEach(node => {
-            let row = document.createElement("tr");
-            row.innerHTML = `<td>${node}</td><td>${distances[node] === Infinity ? "∞" : distances[node]}</td><td>${previous[node] || "-"}</td>`;
-            table.appendChild(row);
-        });
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        let lines = buffer.split("\n");
+        buffer = lines.pop();
+        lines.filter(line => line.trim()).forEach(line => applyDelta(JSON.parse(line)));
     }
-
-    alert("En kısa yollar hesaplandı ve tablo güncellendi!");
+    if (buffer.trim()) applyDelta(JSON.parse(buffer));
 }
-    function handleCooperationQueue() {
-    let authorId = prompt("Lütfen yazarın ORCID ID'sini giriniz:");
-    if (!authorId) {
-        alert("Geçersiz ORCID ID!");
-        return;
-    }
 
-    let foundAuthor = nodes.get(authorId);
-    if (!foundAuthor) {
-        alert("Bu ORCID ID'ye sahip bir yazar bulunamadı!");
-        return;
-    }
+async function handleCooperationQueue() {
+    let authorId = askOrcid("Lütfen yazarın ORCID ID'sini giriniz:");
+    if (!authorId) return;
 
-    let collaborators = network.getConnectedNodes(authorId);
-    if (collaborators.length === 0) {
+    let result = await callApi(`/api/queue/${encodeURIComponent(authorId)}?weight=papers`);
+    if (!result) return;
+    if (result.queue.length <= 1) {
         alert("Bu yazarın işbirliği yaptığı başka yazar bulunamadı!");
         return;
     }
 
-    let cooperationQueue = new CooperationPriorityQueue();
-
-    let mainAuthorPaperCount = getPaperCount(foundAuthor);
-    cooperationQueue.enqueue(foundAuthor, mainAuthorPaperCount);
-
-    collaborators.forEach(collaboratorId => {
-        let collaborator = nodes.get(collaboratorId);
-        if (collaborator) {
-            let paperCount = getPaperCount(collaborator);
-            cooperationQueue.enqueue(collaborator, paperCount);
-        }
-    });
-
-    let steps = cooperationQueue.getSteps();
-    
     const infoContent = document.getElementById("info-content");
-    let contentHTML = `
-        <h3>Kuyruk Oluşturma Adımları</h3>
-        <p><strong>Seçilen Yazar:</strong> ${foundAuthor.label}</p>
-        <div style="margin-top: 20px;">
-    `;
-
-    steps.forEach((step, index) => {
-        contentHTML += `
-            <div style="margin-bottom: 15px; padding: 10px; background-color: #2a2a2a; border-radius: 4px;">
-                <h4>Adım ${index + 1}</h4>
-                <div style="margin-left: 10px;">
-        `;
-
-        step.queueState.forEach((item, qIndex) => {
-            contentHTML += `
-                ${item.author.label} (${item.paperCount} makale)
-                ${qIndex < step.queueState.length - 1 ? ' → ' : ''}
-            `;
-        });
-
-        contentHTML += `
-                </div>
-                <div style="margin-top: 5px; color: #4CAF50; font-size: 0.9em;">
-                    Eklenen: ${step.newItem.author.label} (${step.newItem.paperCount} makale)
-                </div>
-            </div>
-        `;
-    });
-
-    contentHTML += `
-        <div style="margin-top: 20px; padding: 10px; background-color: #3a3a3a; border-radius: 4px;">
-            <h4>Final Sıralaması</h4>
-            <div style="margin-left: 10px;">
+    infoContent.innerHTML = `
+        <h3>Kuyruk İşlemleri</h3>
+        <p><strong>Seçilen Yazar:</strong> ${nodes.get(authorId).label}</p>
+        <div id="queue-log" style="margin-top: 20px; max-height: 60vh; overflow-y: auto;"></div>
     `;
-
-    cooperationQueue.getItems().forEach((item, index) => {
-        contentHTML += `
-            ${item.author.label} (${item.paperCount} makale)
-            ${index < cooperationQueue.getItems().length - 1 ? ' → ' : ''}
-        `;
+    const logContainer = document.getElementById("queue-log");
+    result.events.forEach(event => {
+        const author = nodes.get(event.orcid) || { label: event.orcid };
+        addOperationLog(logContainer, author, event.weight, event.action === "enqueue");
     });
-
-    contentHTML += `
-            </div>
-        </div>
-    `;
-
-    infoContent.innerHTML = contentHTML;
-}
-
-class CooperationPriorityQueue {
-    constructor() {
-        this.items = [];
-        this.steps = [];
-    }
-
-    enqueue(author, paperCount) {
-        const queueItem = { author, paperCount };
-        
-        let currentState = [...this.items];
-        
-        let added = false;
-        for (let i = 0; i < this.items.length; i++) {
-            if (this.items[i].paperCount < queueItem.paperCount) {
-                this.items.splice(i, 0, queueItem);
-                added = true;
-                break;
-            }
-        }
-        if (!added) {
-            this.items.push(queueItem);
-        }
-
-        this.steps.push({
-            action: "ekleme",
-            newItem: queueItem,
-            queueState: [...this.items]
-        });
-
-        return queueItem;
-    }
-
-    getItems() {
-        return this.items;
-    }
-
-    getSteps() {
-        return this.steps;
-    }
-}
-
-function getPaperCount(node) {
-    if (node.title) {
-        const papers = node.title.match(/<b>Makaleler:<\/b><br>(.*?)(?=<\/div>|$)/s);
-        if (papers && papers[1]) {
-            return papers[1].split('<br>').filter(paper => paper.trim()).length;
-        }
-    }
-    return 0;
 }
 
 function addOperationLog(container, author, paperCount, isEnqueue) {
@@ -547,36 +451,24 @@ function addOperationLog(container, author, paperCount, isEnqueue) {
     container.appendChild(logItem);
     container.scrollTop = container.scrollHeight;
 }
-function findShortestPath() {
-    let startNodeId = prompt("Lütfen başlangıç yazarının ORCID ID'sini giriniz:");
-    if (!startNodeId) {
-        alert("Geçersiz başlangıç ORCID ID!");
-        return;
-    }
-
-    let endNodeId = prompt("Lütfen hedef yazarının ORCID ID'sini giriniz:");
-    if (!endNodeId) {
-        alert("Geçersiz hedef ORCID ID!");
-        return;
-    }
 
-    let foundStartNode = nodes.get(startNodeId);
-    let foundEndNode = nodes.get(endNodeId);
-
-    if (!foundStartNode || !foundEndNode) {
-        alert("Başlangıç veya hedef yazar bulunamadı!");
-        return;
-    }
-
-    // Dijkstra algoritması ile en kısa yolu bul
-    let shortestPath = dijkstra(startNodeId, endNodeId);
-    if (!shortestPath) {
+async function findShortestPath() {
+    let startNodeId = askOrcid("Lütfen başlangıç yazarının ORCID ID'sini giriniz:");
+    if (!startNodeId) return;
+    let endNodeId = askOrcid("Lütfen hedef yazarının ORCID ID'sini giriniz:");
+    if (!endNodeId) return;
+
+    let result = await callApi(
+        `/api/shortest-path?start=${encodeURIComponent(startNodeId)}&end=${encodeURIComponent(endNodeId)}`
+    );
+    if (!result) return;
+    if (!result.path) {
         alert("A ile B arasında bir yol bulunamadı.");
         return;
     }
 
     // Yolu grafiksel olarak göster
-    highlightPath(shortestPath.path);
+    highlightPath(result.path);
 
     // Bilgi panelini güncelle
     const infoContent = document.getElementById("info-content");
@@ -584,75 +476,21 @@ function findShortestPath() {
         <h3>En Kısa Yol Bilgileri</h3>
         <p><strong>Başlangıç:</strong> ${startNodeId}</p>
         <p><strong>Hedef:</strong> ${endNodeId}</p>
-        <p><strong>En Kısa Yol:</strong> ${shortestPath.path.join(" → ")}</p>
-        <p><strong>Toplam Ağırlık:</strong> ${shortestPath.totalWeight}</p>
+        <p><strong>En Kısa Yol:</strong> ${result.path.join(" → ")}</p>
+        <p><strong>Toplam Ağırlık:</strong> ${result.distance}</p>
     `;
 }
 
-
-function dijkstra(startNodeId, endNodeId) {
-    let distances = {};
-    let previous = {};
-    let pq = new PriorityQueue();
-    let visited = new Set();
-
-    nodes.forEach(node => {
-        distances[node.id] = Infinity;
-        previous[node.id] = null;
-    });
-    distances[startNodeId] = 0;
-    pq.enqueue(startNodeId, 0);
-
-    while (!pq.isEmpty()) {
-        let currentNode = pq.dequeue().element;
-        if (visited.has(currentNode)) continue;
-        visited.add(currentNode);
-
-        if (currentNode === endNodeId) {
-            let path = [];
-            let totalWeight = distances[endNodeId];
-            while (currentNode) {
-                path.unshift(currentNode);
-                currentNode = previous[currentNode];
-            }
-            return { path, totalWeight };
-        }
-
-        let neighbors = network.getConnectedEdges(currentNode);
-        neighbors.forEach(edgeId => {
-            let edge = edges.get(edgeId);
-            let neighbor = edge.from === currentNode ? edge.to : edge.from;
-
-            if (!visited.has(neighbor)) {
-                let newDist = distances[currentNode] + (edge.value || 1); // Kenar ağırlığı
-                if (newDist < distances[neighbor]) {
-                    distances[neighbor] = newDist;
-                    previous[neighbor] = currentNode;
-                    pq.enqueue(neighbor, newDist);
-                }
-            }
-        });
-    }
-
-    return null; // Eğer hedef düğüme ulaşılamazsa
-}
-
 function highlightPath(path) {
-    // Tüm kenar renklerini eski haline döndür
-    edges.forEach(edge => {
-        edges.update({ id: edge.id, color: { color: "#848484" } });
-    });
+    // Yalnızca önceki yolun kenarlarını eski haline döndür
+    edges.update(highlightedEdges.map(id => ({ id, color: { color: "#848484" } })));
 
+    highlightedEdges = [];
     for (let i = 0; i < path.length - 1; i++) {
-        let source = path[i];
-        let target = path[i + 1];
-
-        edges.forEach(edge => {
-            if ((edge.from === source && edge.to === target) || (edge.from === target && edge.to === source)) {
-                edges.update({ id: edge.id, color: { color: "#ff0000" } });
-            }
-        });
+        let id = edgeId(path[i], path[i + 1]);
+        if (edges.get(id)) highlightedEdges.push(id);
     }
+    edges.update(highlightedEdges.map(id => ({ id, color: { color: "#ff0000" } })));
 
     network.fit({
         nodes: path,
@@ -663,116 +501,38 @@ function highlightPath(path) {
     });
 }
 
-class PriorityQueue {
-    constructor() {
-        this.items = [];
-    }
-
-    enqueue(element, priority) {
-        let newItem = { element, priority };
-        let added = false;
-
-        for (let i = 0; i < this.items.length; i++) {
-            if (this.items[i].priority > newItem.priority) {
-                this.items.splice(i, 0, newItem);
-                added = true;
-                break;
-            }
-        }
-
-        if (!added) this.items.push(newItem);
-    }
-
-    dequeue() {
-        return this.items.shift();
-    }
-
-    isEmpty() {
-        return this.items.length === 0;
-    }
-}
-
-function findLongestPathFromAuthor() {
-    let startNodeId = prompt("Lütfen bir ORCID ID giriniz:");
-    if (!startNodeId) {
-        alert("Geçersiz ORCID ID!");
-        return;
-    }
-
-    let foundNode = nodes.get(startNodeId);
-    if (!foundNode) {
-        alert("Bu ORCID ID'ye sahip bir yazar bulunamadı!");
-        return;
-    }
+async function findLongestPathFromAuthor() {
+    let startNodeId = askOrcid("Lütfen bir ORCID ID giriniz:");
+    if (!startNodeId) return;
 
-    let visited = new Set();
-    let longestPath = [];
+    let result = await callApi(`/api/longest-path/${encodeURIComponent(startNodeId)}?timeout=5`);
+    if (!result) return;
 
-    function dfs(nodeId, path) {
-        visited.add(nodeId);
-        path.push(nodeId);
-
-        let neighbors = network.getConnectedNodes(nodeId);
-        neighbors.forEach(neighbor => {
-            if (!visited.has(neighbor)) {
-                dfs(neighbor, path);
-            }
-        });
-
-        // Eğer bu yol en uzunu ise güncelle
-        if (path.length > longestPath.length) {
-            longestPath = [...path];
-        }
-
-        path.pop(); // Geriye dön
-        visited.delete(nodeId);
-    }
-
-    dfs(startNodeId, []);
-    alert(`ORCID ID: ${startNodeId} için en uzun yol: ${longestPath.join(" → ")} (Uzunluk: ${longestPath.length})`);
+    highlightPath(result.path);
+    let note = result.optimal ? "" : " (süre doldu, bulunan en iyi yol)";
+    alert(`ORCID ID: ${startNodeId} için en uzun yol: ${result.path.join(" → ")} (Uzunluk: ${result.length})${note}`);
 }
 
-    function findAuthorWithMostConnections() {
-        let maxConnections = 0;
-        let authorWithMostConnections = null;
-        let authorNodeId = null;
-
-        if (!nodes || !network) {
-            alert("Düğümler veya ağ tanımlı değil!");
-            return;
-        }
-
-        nodes.forEach(function(node) {
-            let connectionCount = network.getConnectedNodes(node.id).length;
-            if (connectionCount > maxConnections) {
-                maxConnections = connectionCount;
-                authorWithMostConnections = node.label;
-                authorNodeId = node.id;
-            }
-        });
+    async function findAuthorWithMostConnections() {
+        let result = await callApi("/api/most-connected");
+        if (!result) return;
 
-        if (authorNodeId) {
-            highlightNode(authorNodeId);
-            alert(`En fazla bağlantıya sahip yazar: ${authorWithMostConnections} (${maxConnections} bağlantı)`);
+        if (result.authors.length > 0) {
+            let author = result.authors[0];
+            highlightNode(author.orcid);
+            alert(`En fazla bağlantıya sahip yazar: ${nodes.get(author.orcid).label} (${author.value} bağlantı)`);
         }
     }
 
-    function findConnectionsByOrcid() {
-        let orcid = prompt("Lütfen bir ORCID ID giriniz:");
-        if (!orcid) {
-            alert("Geçersiz ORCID ID!");
-            return;
-        }
+    async function findConnectionsByOrcid() {
+        let orcid = askOrcid("Lütfen bir ORCID ID giriniz:");
+        if (!orcid) return;
 
-        let foundNode = nodes.get(orcid);
-        if (!foundNode) {
-            alert("Bu ORCID ID'ye sahip bir yazar bulunamadı!");
-            return;
-        }
+        let result = await callApi(`/api/degree/${encodeURIComponent(orcid)}`);
+        if (!result) return;
 
-        let connectionCount = network.getConnectedNodes(orcid).length;
         highlightNode(orcid);
-        alert(`ORCID ID: ${orcid} için toplam bağlantı sayısı: ${connectionCount}`);
+        alert(`ORCID ID: ${orcid} için toplam bağlantı sayısı: ${result.degree}`);
     }
 
     function highlightNode(nodeId) {
@@ -799,42 +559,46 @@ function findLongestPathFromAuthor() {
     """
     
     html_content = html_content.replace('</head>', f'{style}</head>')
-    html_content = html_content.replace('<body>', f'<body>{buttons}')
+    html_content = html_content.replace('<body>', f'<body>{buttons.replace("__API_BASE__", api_base)}')
     html_content = html_content.replace('</body>', r'''
     <script>
-        network.on("click", function(properties) {
+        const paperCache = new Map();
+
+        async function fetchPapers(nodeId) {
+            if (!paperCache.has(nodeId)) {
+                const result = await callApi(`/api/papers/${encodeURIComponent(nodeId)}`);
+                if (!result) return null;
+                paperCache.set(nodeId, result.papers);
+            }
+            return paperCache.get(nodeId);
+        }
+
+        network.on("click", async function(properties) {
             const nodeId = properties.nodes[0];
-            if (nodeId) {
-                const node = nodes.get(nodeId);
-                const infoContent = document.getElementById("info-content");
-
-               
-                const connectionCount = network.getConnectedNodes(nodeId).length;
-                
-                
-                let papersList = '<li>Makale bulunamadı</li>';
-                if (node.title) {
-                    
-                    const titleContent = node.title;
-                    const papersMatch = titleContent.match(/<b>Makaleler:<\/b><br>(.*?)(?=<\/div>|$)/s);
-                    if (papersMatch && papersMatch[1]) {
-                        const papers = papersMatch[1].split('<br>').filter(paper => paper.trim());
-                        if (papers.length > 0) {
-                            papersList = papers.map(paper => `<li>${paper}</li>`).join('');
-                        }
-                    }
-                }
-
-                infoContent.innerHTML = `
-                    <p><strong>ORCID:</strong> ${node.id}</p>
-                    <p><strong>İsim:</strong> ${node.label}</p>
-                    <p><strong>Bağlantı Sayısı:</strong> ${connectionCount}</p>
-                    <p><strong>Makaleler:</strong></p>
-                    <ul>${papersList}</ul>
-                `;
-            } else {
-                document.getElementById("info-content").innerHTML = "Bir düğüme tıklayın...";
+            const infoContent = document.getElementById("info-content");
+            if (!nodeId) {
+                infoContent.innerHTML = "Bir düğüme tıklayın...";
+                return;
             }
+            const node = nodes.get(nodeId);
+            const connectionCount = network.getConnectedNodes(nodeId).length;
+
+            infoContent.innerHTML = `
+                <p><strong>ORCID:</strong> ${node.id}</p>
+                <p><strong>İsim:</strong> ${node.label}</p>
+                <p><strong>Bağlantı Sayısı:</strong> ${connectionCount}</p>
+                <p><strong>Makaleler (${node.paperCount}):</strong></p>
+                <ul id="paper-list">${node.paperCount ? "<li>Yükleniyor...</li>" : "<li>Makale bulunamadı</li>"}</ul>
+            `;
+            if (!node.paperCount) return;
+
+            const papers = await fetchPapers(nodeId);
+            const paperList = document.getElementById("paper-list");
+            // Bu arada başka bir düğüme tıklandıysa liste artık o düğüme ait
+            if (!paperList || network.getSelectedNodes()[0] !== nodeId) return;
+            paperList.innerHTML = papers && papers.length
+                ? papers.map(paper => `<li>${paper}</li>`).join("")
+                : "<li>Makale bulunamadı</li>";
         });
     </script>
     </body>
@@ -845,7 +609,10 @@ function findLongestPathFromAuthor() {
 
 def main():
     try:
-        create_visualization("cleaned_graph_output.json")
+        if os.path.exists("graph_snapshot.bin"):
+            create_visualization("graph_snapshot.bin")
+        else:
+            create_visualization("cleaned_graph_output.json")
         print("Görselleştirme graph_visualization.html dosyasına kaydedildi.")
     except Exception as e:
         print(f"Görselleştirme hatası: {str(e)}")
@@ -0,0 +1,129 @@
+import heapq
+
+
+class EgoNetwork:
+    """
+    Bir yazarın k adımlık ego ağı: merkez, işbirlikçileri ve (k=2 için)
+    onların işbirlikçilerinden oluşan, indüklenmiş alt graf. Komşuluk ve
+    kenar ağırlıkları kurulumda bir kez çıkarılır; mesafe hesabı yalnızca bu
+    alt grafta çalışır, maliyet tüm grafla değil ego ağının boyutuyla orantılıdır.
+    """
+
+    def __init__(self, center, hops, members, adjacency):
+        self.center = center
+        self.hops = hops
+        # düğüm -> merkeze adım sayısı
+        self.members = members
+        # düğüm -> [(komşu, ağırlık)], yalnızca ego ağı içindeki komşular
+        self.adjacency = adjacency
+
+    def __len__(self):
+        return len(self.members)
+
+    def __contains__(self, orcid):
+        return orcid in self.members
+
+    @classmethod
+    def from_graph(cls, graph, center, hops=2):
+        """
+        Tek BFS geçişiyle ego ağını çıkarır. Son seviyeden önceki düğümlerin
+        bütün komşuları zaten ego ağına girdiğinden komşulukları süzülmeden
+        alınır; yalnızca son seviyenin komşulukları üyeliğe göre süzülür.
+        Bileşenin tamamına ulaşılırsa genişletme erken durur.
+        """
+        members = {center: 0}
+        adjacency = {}
+        frontier = [center]
+        component_size = graph.getComponentSize(center)
+        for hop in range(1, hops + 1):
+            if len(members) >= component_size:
+                break
+            next_frontier = []
+            for node in frontier:
+                neighbors = []
+                for neighbor in graph.get_outgoing_edges(node):
+                    if neighbor not in members:
+                        members[neighbor] = hop
+                        next_frontier.append(neighbor)
+                    neighbors.append((neighbor, graph.value(node, neighbor)))
+                adjacency[node] = neighbors
+            frontier = next_frontier
+
+        for node in members:
+            if node not in adjacency:
+                adjacency[node] = [
+                    (neighbor, graph.value(node, neighbor))
+                    for neighbor in graph.get_outgoing_edges(node) if neighbor in members
+                ]
+        return cls(center, hops, members, adjacency)
+
+    def _search(self, distances, previous):
+        """
+        Ego ağında ikili yığınlı Dijkstra. distances ve previous yerinde
+        güncellenir; her kesinleşen düğüm için (düğüm, mesafesi iyileşen
+        komşular) üretilir.
+        """
+        distances[self.center] = 0
+        settled = set()
+        heap = [(0, self.center)]
+        while heap:
+            distance, node = heapq.heappop(heap)
+            if node in settled:
+                continue
+            settled.add(node)
+
+            improved = []
+            for neighbor, weight in self.adjacency[node]:
+                if neighbor in settled:
+                    continue
+                candidate = distance + weight
+                if candidate < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = candidate
+                    previous[neighbor] = node
+                    heapq.heappush(heap, (candidate, neighbor))
+                    improved.append(neighbor)
+            yield node, improved
+
+    def _row(self, node, distances, previous):
+        return {
+            "orcid": node,
+            "hop": self.members[node],
+            "distance": distances.get(node),
+            "previous": previous.get(node),
+        }
+
+    def steps(self):
+        """
+        Ekran için adım adım tablo değişiklikleri. İlk adım (step 0) tüm
+        satırları başlangıç değerleriyle verir; sonraki her adım yalnızca
+        kesinleşen düğümün ve mesafesi iyileşen komşularının satırlarını.
+        """
+        distances = {self.center: 0}
+        previous = {}
+        yield {
+            "step": 0,
+            "settled": None,
+            "rows": [self._row(node, distances, previous) for node in self.members],
+        }
+        for step, (node, improved) in enumerate(self._search(distances, previous), start=1):
+            yield {
+                "step": step,
+                "settled": node,
+                "rows": [self._row(changed, distances, previous) for changed in [node] + improved],
+            }
+
+    def distances(self):
+        """Son tablo: düğüm -> {"distance", "previous"}; ulaşılamayanlarda distance None."""
+        distances = {}
+        previous = {}
+        for _ in self._search(distances, previous):
+            pass
+        return {
+            node: {"distance": distances.get(node), "previous": previous.get(node)}
+            for node in self.members
+        }
+
+
+def ego_network_distances(graph, orcid, hops=2):
+    """A, işbirlikçileri ve onların işbirlikçilerinden oluşan alt grafta en kısa mesafeler."""
+    return EgoNetwork.from_graph(graph, orcid, hops).distances()
@@ -0,0 +1,150 @@
+import json
+import os
+
+import numpy as np
+
+from component_index import ComponentIndex
+from dataset_cache import file_digest
+
+LAYOUT_VERSION = 1
+
+
+def layout_cache_path(source_path):
+    return f"{source_path}.layout.npz"
+
+
+def source_digest(source_path):
+    """Graf dosyasının (ve varsa delta günlüğünün) sha256 özeti; düzen önbelleğinin anahtarı."""
+    digest = file_digest(source_path)
+    if os.path.exists(source_path + ".deltas.jsonl"):
+        digest += file_digest(source_path + ".deltas.jsonl")
+    return digest
+
+
+def component_layout(size, edge_u, edge_v, edge_w, iterations, rng):
+    """
+    Tek bileşen için vektörel Fruchterman-Reingold düzeni. İtme tüm düğüm
+    çiftleri için numpy yayınlamasıyla (büyük bileşenlerde satır parçaları
+    halinde), çekme kenar dizileri üzerinden np.add.at ile hesaplanır.
+    Sıcaklık her adımda doğrusal azalır. Düğümler arası ideal mesafe 1'dir.
+    """
+    if size == 1:
+        return np.zeros((1, 2))
+    positions = rng.uniform(-1.0, 1.0, size=(size, 2)) * np.sqrt(size)
+    attraction_weights = 1.0 + np.log(edge_w.astype(np.float64))
+    temperature = np.sqrt(size)
+    chunk = max(1, (1 << 22) // size)
+
+    for iteration in range(iterations):
+        displacement = np.zeros_like(positions)
+        for start in range(0, size, chunk):
+            delta = positions[start:start + chunk, None, :] - positions[None, :, :]
+            distance_squared = np.maximum((delta ** 2).sum(axis=2), 1e-4)
+            # itme k² / d, yön delta / d  =>  delta / d²
+            displacement[start:start + chunk] += (delta / distance_squared[:, :, None]).sum(axis=1)
+
+        delta = positions[edge_u] - positions[edge_v]
+        distance = np.maximum(np.sqrt((delta ** 2).sum(axis=1)), 1e-2)
+        # çekme d² / k, yön delta / d  =>  delta * d
+        pull = delta * (distance * attraction_weights)[:, None]
+        np.add.at(displacement, edge_u, -pull)
+        np.add.at(displacement, edge_v, pull)
+
+        length = np.maximum(np.sqrt((displacement ** 2).sum(axis=1)), 1e-9)
+        step = np.minimum(length, temperature * (1 - iteration / iterations))
+        positions += displacement / length[:, None] * step[:, None]
+
+    return positions - positions.mean(axis=0)
+
+
+def force_layout(node_count, edge_u, edge_v, edge_w, iterations=100, seed=0):
+    """
+    Bileşenler ayrı ayrı (her biri kendi tohumuyla) yerleştirilir, sonra
+    büyükten küçüğe satırlar halinde yan yana dizilir. Böylece itme maliyeti
+    bileşen boyutlarının kareleri toplamıyla sınırlı kalır ve küçük
+    bileşenler büyük olanın etrafına dağılmaz. (node_count, 2) dizi döner.
+    """
+    components = ComponentIndex()
+    for node in range(node_count):
+        components.add(node)
+    for u, v in zip(edge_u.tolist(), edge_v.tolist()):
+        components.union(u, v)
+
+    edge_root = np.fromiter((components.find(u) for u in edge_u.tolist()), dtype=np.int64, count=len(edge_u))
+    order = np.argsort(edge_root, kind="stable")
+    boundaries = np.flatnonzero(np.diff(edge_root[order])) + 1
+    edges_of = {
+        int(edge_root[group[0]]): group
+        for group in np.split(order, boundaries) if len(group)
+    }
+
+    positions = np.zeros((node_count, 2))
+    placed = []
+    for root, members in components.components():
+        members = np.asarray(sorted(members), dtype=np.int64)
+        local = {node: i for i, node in enumerate(members.tolist())}
+        group = edges_of.get(root, np.zeros(0, dtype=np.int64))
+        local_u = np.fromiter((local[u] for u in edge_u[group].tolist()), dtype=np.int64, count=len(group))
+        local_v = np.fromiter((local[v] for v in edge_v[group].tolist()), dtype=np.int64, count=len(group))
+        rng = np.random.default_rng([seed, int(members[0])])
+        placed.append((members, component_layout(len(members), local_u, local_v, edge_w[group], iterations, rng)))
+
+    # Raf yerleşimi: satır genişliği toplam alanın kareköküyle sınırlanır
+    extents = [np.ptp(layout, axis=0) + 2.0 if len(layout) > 1 else np.array([2.0, 2.0]) for _, layout in placed]
+    row_width = max(np.sqrt(sum(float(w * h) for w, h in extents)), max(float(w) for w, _ in extents))
+    x = y = row_height = 0.0
+    for (members, layout), (width, height) in zip(placed, extents):
+        if x > 0 and x + width > row_width:
+            x, y, row_height = 0.0, y + row_height, 0.0
+        positions[members] = layout - layout.min(axis=0) + [x + 1.0, y + 1.0]
+        x += width
+        row_height = max(row_height, height)
+
+    return positions - positions.mean(axis=0)
+
+
+def graph_layout(graph_data, iterations=100, seed=0, scale=80.0):
+    """writeJsonManual yapısındaki graf için ORCID -> (x, y) piksel konumları."""
+    orcids = [node["orcid"] for node in graph_data["nodes"]]
+    index = {orcid: i for i, orcid in enumerate(orcids)}
+    edges = [edge for edge in graph_data["edges"] if edge["edge"][0] in index and edge["edge"][1] in index]
+    edge_u = np.fromiter((index[edge["edge"][0]] for edge in edges), dtype=np.int64, count=len(edges))
+    edge_v = np.fromiter((index[edge["edge"][1]] for edge in edges), dtype=np.int64, count=len(edges))
+    edge_w = np.fromiter((edge["weight"] for edge in edges), dtype=np.int64, count=len(edges))
+
+    positions = force_layout(len(orcids), edge_u, edge_v, edge_w, iterations, seed) * scale
+    return {orcid: (float(x), float(y)) for orcid, (x, y) in zip(orcids, positions.round(1))}
+
+
+def cached_layout(graph_data, source_path, iterations=100, seed=0, scale=80.0):
+    """
+    graph_layout sonucunu source_path'in yanındaki .layout.npz dosyasında
+    saklar. Anahtar, kaynak dosyanın özeti ve düzen parametreleridir; graf
+    değişmediyse düzen yeniden hesaplanmaz.
+    """
+    cache_path = layout_cache_path(source_path)
+    key = json.dumps({
+        "version": LAYOUT_VERSION,
+        "sha256": source_digest(source_path),
+        "iterations": iterations,
+        "seed": seed,
+        "scale": scale,
+    }, sort_keys=True)
+
+    if os.path.exists(cache_path):
+        try:
+            with np.load(cache_path) as archive:
+                if str(archive["key"]) == key:
+                    return dict(zip(archive["orcids"].tolist(), map(tuple, archive["positions"].tolist())))
+        except (OSError, ValueError, KeyError):
+            pass
+
+    layout = graph_layout(graph_data, iterations, seed, scale)
+    temp_path = f"{cache_path}.tmp.npz"
+    np.savez(
+        temp_path, key=np.array(key),
+        orcids=np.array(list(layout.keys()), dtype=str),
+        positions=np.array(list(layout.values()), dtype=np.float64).reshape(-1, 2),
+    )
+    os.replace(temp_path, cache_path)
+    return layout
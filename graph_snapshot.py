@@ -0,0 +1,172 @@
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from csr_graph import CSRGraph
+
+SNAPSHOT_MAGIC = b"AGRAPH\0\0"
+SNAPSHOT_VERSION = 1
+# magic, sürüm, düğüm, bağlantı, kenar, makale referansı, metin sayısı, metin bloğu uzunluğu
+HEADER = struct.Struct("<8sIxxxxQQQQQQ")
+
+
+class StringTable:
+    """Ofset dizisi + UTF-8 bloğundan oluşan, istendikçe çözülen metin tablosu."""
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return bytes(self.blob[self.offsets[i]:self.offsets[i + 1]]).decode("utf-8")
+
+    def slice(self, start, stop):
+        return [self[i] for i in range(start, stop)]
+
+
+class GraphSnapshot(CSRGraph):
+    """
+    Diskten mmap ile açılan graf. Bağlantılar CSRGraph olarak kullanılır;
+    makaleler ve kenar listesi (görselleştirme için) dosya üzerinde kalır.
+    """
+
+    def __init__(self, orcids, names, indptr, indices, weights, paper_indptr, paper_ids,
+                 edge_u, edge_v, edge_w, strings, buffer=None):
+        super().__init__(orcids, names, indptr, indices, weights, np.diff(paper_indptr))
+        self.paper_indptr = paper_indptr
+        self.paper_ids = paper_ids
+        self.edge_u = edge_u
+        self.edge_v = edge_v
+        self.edge_w = edge_w
+        self.strings = strings
+        # mmap, diziler onu kullandığı sürece açık kalmalı
+        self._buffer = buffer
+
+    def papers(self, node):
+        ids = self.paper_ids[self.paper_indptr[node]:self.paper_indptr[node + 1]]
+        return [self.strings[int(i)] for i in ids]
+
+    def edge_list(self):
+        for u, v, weight in zip(self.edge_u.tolist(), self.edge_v.tolist(), self.edge_w.tolist()):
+            yield self.orcids[u], self.orcids[v], weight
+
+    def to_graph_data(self):
+        """writeJsonManual çıktısıyla aynı yapıda sözlük üretir (deneme.py için)."""
+        nodes = []
+        for node, orcid in enumerate(self.orcids):
+            node_entry = {
+                "orcid": orcid,
+                "name": self.names[node],
+                "connections": [self.names[conn] for conn in self.neighbors(node).tolist()]
+            }
+            if not orcid.startswith("generated"):
+                node_entry["papers"] = self.papers(node)
+            nodes.append(node_entry)
+        edges = [{"edge": [u, v], "weight": weight} for u, v, weight in self.edge_list()]
+        return {"nodes": nodes, "edges": edges}
+
+
+def _padding(length):
+    return b"\0" * (-length % 8)
+
+
+def write_snapshot(graph, output_file="graph_snapshot.bin", clear_deltas=True):
+    """
+    Graph nesnesini sürümlü ikili dosyaya yazar: sabit genişlikli
+    bağlantı/ağırlık/makale/kenar dizileri ve ORCID, isim ve makale
+    başlıklarını tutan bir metin tablosu. clear_deltas True ise yeni dosya
+    yerine konduktan sonra önceki delta günlüğü silinir.
+    """
+    csr = CSRGraph.from_graph(graph)
+    node_count = len(csr)
+
+    paper_index = {}
+    paper_ids = []
+    paper_indptr = np.zeros(node_count + 1, dtype=np.int64)
+    for node, node_data in enumerate(graph.getNodes().values()):
+        for paper in node_data["papers"]:
+            paper_ids.append(paper_index.setdefault(paper, node_count * 2 + len(paper_index)))
+        paper_indptr[node + 1] = len(paper_ids)
+
+    edge_u = np.fromiter((csr.index[u] for u, _ in graph.edges), dtype=np.int32, count=len(graph.edges))
+    edge_v = np.fromiter((csr.index[v] for _, v in graph.edges), dtype=np.int32, count=len(graph.edges))
+    edge_w = np.fromiter(graph.edges.values(), dtype=np.int32, count=len(graph.edges))
+
+    encoded = [s.encode("utf-8") for s in csr.orcids + csr.names + list(paper_index)]
+    string_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(s) for s in encoded], out=string_offsets[1:])
+    blob = b"".join(encoded)
+
+    sections = [
+        csr.indptr, csr.indices, csr.weights,
+        paper_indptr, np.asarray(paper_ids, dtype=np.int32),
+        edge_u, edge_v, edge_w,
+        string_offsets,
+    ]
+    # Okuyucular eski dosyayı mmap ile açık tutabilir: yerinde kırpmak yerine
+    # geçici dosyaya yazılır ve tamamlanınca os.replace ile yerine konur
+    temp_path = f"{output_file}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, node_count, len(csr.indices), len(edge_w),
+            len(paper_ids), len(encoded), len(blob)
+        ))
+        for array in sections:
+            data = array.astype(array.dtype.newbyteorder("<"), copy=False).tobytes()
+            file.write(data + _padding(len(data)))
+        file.write(blob)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, output_file)
+
+    # Yeni anlık görüntü önceki delta günlüğünü kapsar
+    if clear_deltas and os.path.exists(output_file + ".deltas.jsonl"):
+        os.remove(output_file + ".deltas.jsonl")
+
+    print(f"Graph written to snapshot file: {output_file}")
+
+
+def load_snapshot(input_file="graph_snapshot.bin"):
+    """Anlık görüntüyü mmap ile açar; diziler kopyalanmadan dosyadan okunur."""
+    with open(input_file, "rb") as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, node_count, conn_count, edge_count, paper_ref_count, string_count, blob_length = \
+        HEADER.unpack_from(buffer, 0)
+    if magic != SNAPSHOT_MAGIC:
+        buffer.close()
+        raise ValueError(f"{input_file} is not a graph snapshot")
+    if version != SNAPSHOT_VERSION:
+        buffer.close()
+        raise ValueError(f"Unsupported snapshot version {version} in {input_file}")
+
+    offset = HEADER.size
+
+    def take(dtype, count):
+        nonlocal offset
+        array = np.frombuffer(buffer, dtype=np.dtype(dtype).newbyteorder("<"), count=count, offset=offset)
+        offset += array.nbytes + len(_padding(array.nbytes))
+        return array
+
+    indptr = take(np.int64, node_count + 1)
+    indices = take(np.int32, conn_count)
+    weights = take(np.int32, conn_count)
+    paper_indptr = take(np.int64, node_count + 1)
+    paper_ids = take(np.int32, paper_ref_count)
+    edge_u = take(np.int32, edge_count)
+    edge_v = take(np.int32, edge_count)
+    edge_w = take(np.int32, edge_count)
+    string_offsets = take(np.int64, string_count + 1)
+    blob = memoryview(buffer)[offset:offset + blob_length]
+
+    strings = StringTable(string_offsets, blob)
+    return GraphSnapshot(
+        strings.slice(0, node_count), strings.slice(node_count, 2 * node_count),
+        indptr, indices, weights, paper_indptr, paper_ids,
+        edge_u, edge_v, edge_w, strings, buffer
+    )
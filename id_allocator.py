@@ -0,0 +1,61 @@
+import hashlib
+import json
+import os
+
+
+class IdAllocator:
+    """
+    ORCID'i olmayan ortak yazarlar için generated-N kimliği üretir.
+    N, ismin blake2b özetinden gelir (çalıştırmalar arasında değişmez); özet
+    başka bir isme ait bir kimliğe düşerse sıradaki numara denenir (doğrusal
+    yoklama). Verilen kimlikler isim -> kimlik sözlüğünde tutulur ve path
+    verilmişse JSON olarak saklanır, böylece sonraki çalıştırmalarda yalnızca
+    yeni isimler için kimlik hesaplanır ve eski kimlikler değişmez.
+    """
+
+    def __init__(self, path=None, prefix="generated-", space=10 ** 9):
+        self.path = path
+        self.prefix = prefix
+        self.space = space
+        self.ids = {}
+        self.owners = {}
+        self.dirty = False
+        if path is not None and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as file:
+                self.ids = json.load(file)
+            self.owners = {generated_id: name for name, generated_id in self.ids.items()}
+
+    def __contains__(self, name):
+        return name in self.ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def get(self, name):
+        return self.ids.get(name)
+
+    def allocate(self, name):
+        generated_id = self.ids.get(name)
+        if generated_id is not None:
+            return generated_id
+
+        digest = hashlib.blake2b(name.encode("utf-8"), digest_size=8).digest()
+        slot = int.from_bytes(digest, "big") % self.space
+        generated_id = f"{self.prefix}{slot}"
+        while generated_id in self.owners:
+            slot = (slot + 1) % self.space
+            generated_id = f"{self.prefix}{slot}"
+
+        self.ids[name] = generated_id
+        self.owners[generated_id] = name
+        self.dirty = True
+        return generated_id
+
+    def save(self):
+        if self.path is None or not self.dirty:
+            return
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(self.ids, file, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_path, self.path)
+        self.dirty = False
@@ -0,0 +1,440 @@
+import argparse
+import json
+import os
+
+import pandas as pd
+
+from main import Graph, load_graph, parse_coauthors
+from id_allocator import IdAllocator
+from dataset_cache import append_ingested_rows
+from graph_snapshot import load_snapshot, write_snapshot
+
+
+def _text(value):
+    """Eksik hücre (None/NaN) için None, aksi halde metin."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return str(value)
+
+
+def json_row(row):
+    """
+    Satırı veri seti günlüğüne yazılabilir hale getirir: eksik hücreler None,
+    numpy sayıları Python sayısı, liste olarak verilen ortak yazarlar veri
+    setindeki "['a','b']" biçimi olur.
+    """
+    result = {}
+    for column, value in row.items():
+        if isinstance(value, list):
+            value = "[" + ",".join(repr(name) for name in value) + "]"
+        elif hasattr(value, "item"):
+            value = value.item()
+        if not isinstance(value, str) and value is not None and pd.isna(value):
+            value = None
+        result[column] = value
+    return result
+
+
+class GraphIngestor:
+    """
+    Kurulmuş bir grafa yeni veri satırlarını yerinde ekler. Sonuç, aynı
+    satırlarla build_graph'ın baştan kuracağı grafla aynıdır; bunun için
+    build_graph'ın kuralları satır düzeyindeki tablolarla izlenir:
+
+    - ORCID'li düğümün adı, (isim, ORCID, makale) üçlülerinden son görülenin
+      adıdır. Bir isim, o ada sahip ilk görülen ORCID'e çözülür; sahibi yoksa
+      allocator'dan generated-* kimliği alır.
+    - (yazar ORCID'i, ortak yazar ismi) çiftleri sayılır. Kenar ağırlığı o
+      kenara çözülen çiftlerin toplamı, bağlantı sırası kenarın ilk görüldüğü
+      satırdır.
+
+    Bir ismin çözümü değiştiğinde (ör. ORCID yeni bir isimle geldiğinde)
+    yalnızca o ismi anan çiftler yeniden çözülür, sahibi çıkan isimlerin
+    generated-* düğümleri silinir. clean_connections yalnızca dokunulan
+    düğümlere uygulanır; iş toplu satır sayısı ve etkilenen çiftlerle orantılıdır.
+    """
+
+    def __init__(self, graph, data, allocator=None):
+        self.graph = graph
+        self.allocator = allocator if allocator is not None else IdAllocator()
+        self.row_count = 0
+        self.author_triples = set()
+        self.author_names = {}
+        self.first_seen = {}
+        self.owners = {}
+        self.papers = {}
+        self.self_names = {}
+        self.cited = set()
+        # (yazar, ortak yazar ismi) -> [sayı, ilk görüldüğü (satır, sıra)]
+        self.pairs = {}
+        self.citers = {}
+        self.authored = {}
+        self.resolution = {}
+        self.generated = {}
+        self.contribution = {}
+        self.edge_pairs = {}
+        self.edge_rank = {}
+        self.incident = {}
+        # Graf data ile kurulmuştur; tablolar grafa dokunulmadan doldurulur
+        self._settle(self._absorb(data.to_dict("records")), apply=False)
+
+    def _name(self, orcid):
+        name = self.author_names.get(orcid)
+        return name if name is not None else self.generated.get(orcid)
+
+    def _rename(self, orcid, name, changes):
+        old = self.author_names.get(orcid)
+        if old == name:
+            return
+        self.first_seen.setdefault(orcid, len(self.first_seen))
+        if old is not None:
+            self.owners[old].discard(orcid)
+            changes["names"].add(old)
+        self.owners.setdefault(name, set()).add(orcid)
+        changes["names"].add(name)
+        self.author_names[orcid] = name
+        changes["renamed"].setdefault(orcid, old)
+
+    def _absorb(self, rows):
+        """Satırları tablolara işler; grafta neyin yeniden hesaplanacağını döndürür."""
+        changes = {"names": set(), "renamed": {}, "pairs": set(), "papers": {}, "cleanup": set()}
+        for row in rows:
+            rank = self.row_count
+            self.row_count += 1
+            orcid = _text(row.get("orcid"))
+            orcid = orcid.lower() if orcid is not None else None
+            author_name = _text(row.get("author_name"))
+            paper_title = _text(row.get("paper_title"))
+
+            if orcid is not None and author_name is not None:
+                own_names = self.self_names.setdefault(orcid, set())
+                own_name = author_name.strip().lower()
+                if own_name not in own_names:
+                    own_names.add(own_name)
+                    changes["cleanup"].add(orcid)
+
+            if orcid is not None and paper_title is not None:
+                papers = self.papers.setdefault(orcid, {})
+                if paper_title not in papers:
+                    papers[paper_title] = None
+                    changes["papers"].setdefault(orcid, []).append(paper_title)
+                if author_name is not None:
+                    triple = (author_name.lower(), orcid, paper_title)
+                    if triple not in self.author_triples:
+                        self.author_triples.add(triple)
+                        self._rename(orcid, triple[0], changes)
+
+            coauthors = row.get("coauthors")
+            if not isinstance(coauthors, list):
+                coauthors = parse_coauthors(coauthors)
+            for position, coauthor in enumerate(coauthors):
+                if coauthor not in self.cited:
+                    self.cited.add(coauthor)
+                    changes["names"].add(coauthor)
+                if orcid is None:
+                    continue
+                key = (orcid, coauthor)
+                pair = self.pairs.get(key)
+                if pair is None:
+                    self.pairs[key] = [1, (rank, position)]
+                    self.citers.setdefault(coauthor, set()).add(orcid)
+                    self.authored.setdefault(orcid, set()).add(coauthor)
+                else:
+                    pair[0] += 1
+                changes["pairs"].add(key)
+        return changes
+
+    def _settle(self, changes, apply=True):
+        """
+        İsim çözümlerini, çiftlerin katkı verdiği kenarları ve kenar
+        ağırlıklarını günceller. apply True ise değişiklikler grafa uygulanır
+        ve delta döner.
+        """
+        pairs = changes["pairs"]
+        created, dropped = [], []
+        for name in changes["names"]:
+            owners = self.owners.get(name)
+            if owners:
+                target = min(owners, key=self.first_seen.__getitem__)
+                stale = self.allocator.get(name)
+                if stale in self.generated:
+                    del self.generated[stale]
+                    dropped.append(stale)
+            elif name in self.cited:
+                target = self.allocator.allocate(name)
+                if target not in self.generated:
+                    self.generated[target] = name
+                    created.append(target)
+            else:
+                target = None
+            if self.resolution.get(name) != target:
+                self.resolution[name] = target
+                pairs.update((citer, name) for citer in self.citers.get(name, ()))
+
+        touched = set()
+        for orcid in changes["renamed"]:
+            pairs.update((orcid, name) for name in self.authored.get(orcid, ()))
+            touched.add(orcid)
+            for edge in self.incident.get(orcid, ()):
+                touched.update(edge)
+
+        changed_edges = set()
+        for key in pairs:
+            author, coauthor = key
+            target = self.resolution.get(coauthor)
+            edge = None
+            if author in self.author_names and target is not None and target != author \
+                    and self.author_names[author] != self._name(target):
+                edge = (min(author, target), max(author, target))
+            old_edge = self.contribution.get(key)
+            if old_edge != edge:
+                if old_edge is not None:
+                    self.edge_pairs[old_edge].discard(key)
+                    changed_edges.add(old_edge)
+                if edge is not None:
+                    self.edge_pairs.setdefault(edge, set()).add(key)
+                self.contribution[key] = edge
+            if edge is not None:
+                changed_edges.add(edge)
+
+        weights = {}
+        for edge in changed_edges:
+            keys = self.edge_pairs.get(edge)
+            if keys:
+                weights[edge] = sum(self.pairs[key][0] for key in keys)
+                self.edge_rank[edge] = min(self.pairs[key][1] for key in keys)
+                for orcid in edge:
+                    self.incident.setdefault(orcid, set()).add(edge)
+            else:
+                weights[edge] = None
+                self.edge_pairs.pop(edge, None)
+                self.edge_rank.pop(edge, None)
+                for orcid in edge:
+                    self.incident.get(orcid, set()).discard(edge)
+
+        if apply:
+            return self._apply(changes, created, dropped, weights, touched)
+
+    def _apply(self, changes, created, dropped, weights, touched):
+        graph = self.graph
+        nodes = graph.getNodes()
+        delta = {"nodes": [], "removed": [], "papers": {}, "edges": {}, "connections": {}}
+
+        for orcid in changes["renamed"]:
+            name = self.author_names[orcid]
+            if orcid in nodes:
+                nodes[orcid]["name"] = name
+            else:
+                graph.addNode(orcid, name)
+                nodes[orcid]["papers"] = graph.collection(self.papers.get(orcid, ()))
+                delta["papers"][orcid] = list(nodes[orcid]["papers"])
+            delta["nodes"].append({"orcid": orcid, "name": name})
+        for generated_id in created:
+            if generated_id in self.generated:
+                graph.addNode(generated_id, self.generated[generated_id])
+                delta["nodes"].append({"orcid": generated_id, "name": self.generated[generated_id]})
+                touched.add(generated_id)
+        for orcid, titles in changes["papers"].items():
+            if orcid in nodes and orcid not in delta["papers"]:
+                for paper_title in titles:
+                    graph.addPaper(orcid, paper_title)
+                delta["papers"][orcid] = titles
+
+        removed_edge = False
+        for edge, weight in weights.items():
+            if graph.edges.get(edge) == weight:
+                continue
+            if weight is None:
+                del graph.edges[edge]
+                removed_edge = True
+            else:
+                if edge not in graph.edges:
+                    graph.components.union(*edge)
+                graph.edges[edge] = weight
+            delta["edges"]["|".join(edge)] = weight
+            touched.update(edge)
+
+        for generated_id in dropped:
+            if generated_id in nodes:
+                graph.removeNode(generated_id)
+                delta["removed"].append(generated_id)
+        if removed_edge or dropped:
+            graph.rebuildComponents()
+
+        for orcid in touched | changes["cleanup"]:
+            if orcid not in nodes:
+                continue
+            ordered = sorted(self.incident.get(orcid, ()), key=self.edge_rank.__getitem__)
+            connections = (edge[1] if edge[0] == orcid else edge[0] for edge in ordered)
+            if not orcid.startswith("generated"):
+                own_names = self.self_names.get(orcid, set())
+                connections = (conn for conn in connections if nodes[conn]["name"] not in own_names)
+            nodes[orcid]["connections"] = graph.collection(connections)
+            graph.refreshDegree(orcid)
+            delta["connections"][orcid] = list(nodes[orcid]["connections"])
+        return delta
+
+    def ingest(self, rows):
+        """
+        rows: orcid, author_name, coauthors, paper_title alanlarını içeren
+        sözlükler ya da DataFrame. Uygulanan değişiklikleri anlatan, JSON'a
+        yazılabilir bir delta döndürür (bkz. apply_delta, apply_graph_delta).
+        """
+        if isinstance(rows, pd.DataFrame):
+            rows = rows.to_dict("records")
+        return self._settle(self._absorb(rows))
+
+
+def apply_delta(graph_data, delta):
+    """
+    writeJsonManual biçimindeki graf sözlüğüne (deneme.py'nin okuduğu yapı)
+    bir ingest deltasını uygular.
+    """
+    node_entries = {node["orcid"]: node for node in graph_data["nodes"]}
+    for node in delta["nodes"]:
+        entry = node_entries.get(node["orcid"])
+        if entry is None:
+            entry = {"orcid": node["orcid"], "name": node["name"], "connections": []}
+            if not node["orcid"].startswith("generated"):
+                entry["papers"] = []
+            graph_data["nodes"].append(entry)
+            node_entries[node["orcid"]] = entry
+        else:
+            entry["name"] = node["name"]
+    if delta["removed"]:
+        removed = set(delta["removed"])
+        graph_data["nodes"] = [node for node in graph_data["nodes"] if node["orcid"] not in removed]
+        for orcid in removed:
+            del node_entries[orcid]
+
+    for orcid, papers in delta["papers"].items():
+        node_entries[orcid].setdefault("papers", []).extend(papers)
+    for orcid, connections in delta["connections"].items():
+        node_entries[orcid]["connections"] = [node_entries[conn]["name"] for conn in connections]
+
+    edge_entries = {"|".join(edge["edge"]): edge for edge in graph_data["edges"]}
+    for key, weight in delta["edges"].items():
+        if weight is None:
+            edge_entries.pop(key, None)
+        elif key in edge_entries:
+            edge_entries[key]["weight"] = weight
+        else:
+            edge_entries[key] = {"edge": key.split("|"), "weight": weight}
+    graph_data["edges"] = list(edge_entries.values())
+    return graph_data
+
+
+def apply_graph_delta(graph, delta):
+    """Bir ingest deltasını Graph nesnesine (ör. anlık görüntüden kurulan) uygular."""
+    nodes = graph.getNodes()
+    for node in delta["nodes"]:
+        if node["orcid"] in nodes:
+            nodes[node["orcid"]]["name"] = node["name"]
+        else:
+            graph.addNode(node["orcid"], node["name"])
+    for orcid, papers in delta["papers"].items():
+        for paper_title in papers:
+            graph.addPaper(orcid, paper_title)
+    for key, weight in delta["edges"].items():
+        edge = tuple(key.split("|"))
+        if weight is None:
+            graph.edges.pop(edge, None)
+        else:
+            graph.edges[edge] = weight
+    for orcid in delta["removed"]:
+        graph.removeNode(orcid)
+    for orcid, connections in delta["connections"].items():
+        nodes[orcid]["connections"] = graph.collection(connections)
+    for orcid in delta["connections"]:
+        graph.refreshDegree(orcid)
+    graph.rebuildComponents()
+    return graph
+
+
+def snapshot_graph(snapshot):
+    """GraphSnapshot'tan (bağlantı ve makale sırası korunarak) Graph kurar."""
+    graph = Graph()
+    orcids = snapshot.orcids
+    for node, orcid in enumerate(orcids):
+        graph.addNode(orcid, snapshot.names[node])
+        graph.nodes[orcid]["papers"] = graph.collection(snapshot.papers(node))
+    for orcid_1, orcid_2, weight in snapshot.edge_list():
+        graph.edges[(orcid_1, orcid_2)] = weight
+    for node, orcid in enumerate(orcids):
+        graph.nodes[orcid]["connections"] = graph.collection(orcids[conn] for conn in snapshot.neighbors(node).tolist())
+        graph.refreshDegree(orcid)
+    graph.rebuildComponents()
+    return graph
+
+
+def apply_deltas_to_snapshot(snapshot_path="graph_snapshot.bin"):
+    """
+    Anlık görüntünün delta günlüğünü ikili dosyaya işler: anlık görüntü Graph
+    olarak açılır, deltalar sırayla uygulanır ve dosya atomik olarak yeniden
+    yazılır. Günlük önce yeniden adlandırılır, böylece bu sırada eklenen
+    deltalar yeni günlükte kalır. Günlük yoksa False döner.
+    """
+    delta_file = snapshot_path + ".deltas.jsonl"
+    if not os.path.exists(delta_file):
+        return False
+    applying = delta_file + ".applying"
+    os.replace(delta_file, applying)
+    graph = snapshot_graph(load_snapshot(snapshot_path))
+    for delta in read_deltas(applying):
+        apply_graph_delta(graph, delta)
+    write_snapshot(graph, snapshot_path, clear_deltas=False)
+    os.remove(applying)
+    return True
+
+
+def append_delta(delta, delta_file):
+    """Deltayı anlık görüntünün yanındaki JSON Lines günlüğüne ekler."""
+    with open(delta_file, "a", encoding="utf-8") as file:
+        file.write(json.dumps(delta, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+
+def read_deltas(delta_file):
+    with open(delta_file, "r", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_rows(path):
+    """Yeni satırlar: .xlsx, .csv ya da .jsonl (satır başına bir JSON nesnesi)."""
+    if path.endswith(".xlsx"):
+        return pd.read_excel(path).to_dict("records")
+    if path.endswith(".csv"):
+        return pd.read_csv(path).to_dict("records")
+    with open(path, "r", encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yeni veri satırlarını grafa ve anlık görüntüye ekler")
+    parser.add_argument("rows", help="Yeni satırlar (.xlsx, .csv ya da .jsonl)")
+    parser.add_argument("--dataset", default="data/dataset.xlsx")
+    parser.add_argument("--id-file", default="data/generated_ids.json")
+    parser.add_argument("--snapshot", default="graph_snapshot.bin")
+    parser.add_argument("--compact", action="store_true", help="Delta günlüğünü anlık görüntüye hemen işle")
+    args = parser.parse_args()
+
+    rows = read_rows(args.rows)
+    authorGraph, data = load_graph(args.dataset, args.id_file)
+    allocator = IdAllocator(args.id_file)
+    delta = GraphIngestor(authorGraph, data, allocator).ingest(rows)
+    allocator.save()
+    append_ingested_rows(args.dataset, [json_row(row) for row in rows])
+
+    if os.path.exists(args.snapshot):
+        append_delta(delta, args.snapshot + ".deltas.jsonl")
+        if args.compact:
+            apply_deltas_to_snapshot(args.snapshot)
+    else:
+        write_snapshot(authorGraph, args.snapshot)
+    print(f"{len(rows)} satır eklendi: {len(delta['nodes'])} düğüm eklendi/güncellendi, "
+          f"{len(delta['removed'])} düğüm silindi, {len(delta['edges'])} kenar değişti")
+
+
+if __name__ == "__main__":
+    main()
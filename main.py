@@ -1,7 +1,22 @@
 from flask import Flask, jsonify, request, render_template
+import numpy as np
 import pandas as pd
 import sys
 import json
+import gzip
+import contextlib
+import heapq
+import time
+
+from dataset_cache import read_dataset, read_ingested_rows
+from degree_index import DegreeIndex
+from ordered_set import OrderedSet
+from component_index import ComponentIndex
+from id_allocator import IdAllocator
+from graph_snapshot import write_snapshot
+from priority_queue import build_collaborator_queue
+from author_tree import AuthorTree
+from longest_path import DEFAULT_TIME_LIMIT, find_longest_path_bounded
 
 def parse_coauthors(coauthor_str):
     if pd.isna(coauthor_str):
@@ -11,36 +26,71 @@ def parse_coauthors(coauthor_str):
     return coauthor_list
 
 def clean_connections(graph, data):
-    orcid_to_names = {}
-    for _, row in data.iterrows():
-        orcid = row["orcid"].lower()
-        name = row["author_name"].strip().lower()
-        if orcid not in orcid_to_names:
-            orcid_to_names[orcid] = set()
-        orcid_to_names[orcid].add(name)
+    orcid_to_names = (
+        data["author_name"].str.strip().str.lower()
+        .groupby(data["orcid"].str.lower(), sort=False).agg(set).to_dict()
+    )
 
     for orcid, node_data in graph.nodes.items():  
         if not orcid.startswith("generated"):
             valid_names = orcid_to_names.get(orcid, set())
-            node_data["connections"] = [
+            node_data["connections"] = graph.collection(
                 conn for conn in node_data["connections"]
-                if graph.nodes[conn]["name"] not in valid_names  
-            ]
+                if graph.nodes[conn]["name"] not in valid_names
+            )
+            graph.refreshDegree(orcid)
 
 
 
 class Graph:
-    def __init__(self):
+    def __init__(self, indexed=True):
+        """
+        indexed True ise bağlantılar ve makaleler ekleme sırasını koruyan
+        kümelerde (OrderedSet) tutulur: üyelik testi O(1) olur, okuma ve JSON
+        çıktısının sırası listeyle aynı kalır. False eski liste depolamasıdır.
+        """
+        self.collection = OrderedSet if indexed else list
         self.nodes = {}
         self.edges = {}
+        # Bağlantı sayısı ve kenar ağırlıkları toplamı için kovalı indeksler
+        self.degrees = DegreeIndex()
+        self.weighted_degrees = DegreeIndex()
+        # Kenarlarla birleşen bağlı bileşenler (birleşim-bul)
+        self.components = ComponentIndex()
+        # Her değişiklikte artar; önbellekler bununla geçersiz kılınır
+        self.version = 0
 
     def addNode(self, orcid, author_name):
         if orcid not in self.nodes:
             self.nodes[orcid] = {
                 "name": author_name,
-                "connections": [],
-                "papers": []
+                "connections": self.collection(),
+                "papers": self.collection()
             }
+            self.degrees.add(orcid)
+            self.weighted_degrees.add(orcid)
+            self.components.add(orcid)
+            self.version += 1
+
+    def removeNode(self, orcid):
+        """Bağlantısı kalmamış düğümü siler; bileşenler için rebuildComponents çağrılmalıdır."""
+        if orcid in self.nodes:
+            del self.nodes[orcid]
+            self.degrees.remove(orcid)
+            self.weighted_degrees.remove(orcid)
+            self.version += 1
+
+    def rebuildComponents(self):
+        """
+        Birleşim-bul kenar silmeyi desteklemez; kenar ya da düğüm silindikten
+        sonra bileşenler Graph.edges üzerinden yeniden kurulur.
+        """
+        self.components = ComponentIndex()
+        for orcid in self.nodes:
+            self.components.add(orcid)
+        for orcid_1, orcid_2 in self.edges:
+            self.components.union(orcid_1, orcid_2)
+        self.version += 1
 
     def addPaper(self, orcid, paper_title):
         if orcid in self.nodes and paper_title not in self.nodes[orcid]["papers"]:
@@ -61,132 +111,174 @@ class Graph:
                     self.edges[edge] = weight
                     self.nodes[orcid_1]["connections"].append(orcid_2)
                     self.nodes[orcid_2]["connections"].append(orcid_1)
-
-
-
-
-    def writeJsonManual(self, output_file="graph_output.json"):
-        import json
- 
-        graph_data = {
-            "nodes": [],
-            "edges": []
-        }
-
-        
-        for node_id, node_data in self.nodes.items():
+                    self.degrees.increment(orcid_1)
+                    self.degrees.increment(orcid_2)
+                    self.components.union(orcid_1, orcid_2)
+                self.weighted_degrees.increment(orcid_1, weight)
+                self.weighted_degrees.increment(orcid_2, weight)
+                self.version += 1
+
+    def refreshDegree(self, orcid):
+        """Bağlantı listesi dışarıdan değiştirilen düğümün indekslerini yeniler."""
+        connections = self.nodes[orcid]["connections"]
+        self.version += 1
+        self.degrees.set(orcid, len(connections))
+        self.weighted_degrees.set(orcid, sum(self.value(orcid, conn) for conn in connections))
+
+    def getDegree(self, orcid):
+        return self.degrees.get(orcid)
+
+    def getComponent(self, orcid):
+        return self.components.component(orcid)
+
+    def getComponentSize(self, orcid):
+        return self.components.size(orcid)
+
+    def getComponentMembers(self, orcid):
+        return self.components.component_members(orcid)
+
+    def isConnected(self, orcid_1, orcid_2):
+        """False ise iki yazar arasında kesinlikle yol yoktur (O(α(n)))."""
+        return self.components.connected(orcid_1, orcid_2)
+
+    def topAuthors(self, k=1, weighted=False):
+        """
+        En çok işbirliği yapan k yazarı (orcid, değer) olarak döndürür.
+        weighted True ise bağlantı sayısı yerine kenar ağırlıkları toplamı kullanılır.
+        """
+        index = self.weighted_degrees if weighted else self.degrees
+        return index.top(k)
+
+
+
+
+    def iterJsonChunks(self):
+        """
+        writeJsonManual çıktısını parça parça üretir; tüm graf tek bir
+        sözlükte toplanmaz.
+        """
+        separators = (",", ":")
+        yield '{"nodes":['
+        for i, (node_id, node_data) in enumerate(self.nodes.items()):
             node_entry = {
                 "orcid": node_id,
                 "name": node_data["name"],
                 "connections": [self.nodes[conn]["name"] for conn in node_data["connections"]]
             }
-            
+
             if not node_id.startswith("generated"):
-                node_entry["papers"] = node_data["papers"]
+                node_entry["papers"] = list(node_data["papers"])
 
-            graph_data["nodes"].append(node_entry)
+            yield ("," if i else "") + json.dumps(node_entry, ensure_ascii=False, separators=separators)
 
-        
-        for edge, weight in self.edges.items():
+        yield '],"edges":['
+        for i, (edge, weight) in enumerate(self.edges.items()):
             edge_entry = {
                 "edge": list(edge),
                 "weight": weight
             }
-            graph_data["edges"].append(edge_entry)
+            yield ("," if i else "") + json.dumps(edge_entry, ensure_ascii=False, separators=separators)
+        yield ']}'
 
-        
-        with open(output_file, "w", encoding="utf-8") as file:
-            json.dump(graph_data, file, ensure_ascii=False, indent=4)
+    def writeJsonManual(self, output_file="graph_output.json"):
+        """
+        Grafı JSON olarak yazar. output_file bir liste ise graf tek geçişte
+        bütün dosyalara yazılır; ".gz" ile biten dosyalar gzip ile sıkıştırılır.
+        """
+        output_files = [output_file] if isinstance(output_file, str) else list(output_file)
+
+        with contextlib.ExitStack() as stack:
+            files = [
+                stack.enter_context(
+                    gzip.open(path, "wt", encoding="utf-8") if path.endswith(".gz")
+                    else open(path, "w", encoding="utf-8")
+                )
+                for path in output_files
+            ]
+            for chunk in self.iterJsonChunks():
+                for file in files:
+                    file.write(chunk)
 
-        print(f"Graph written to JSON file: {output_file}")
-        
+        for path in output_files:
+            print(f"Graph written to JSON file: {path}")
 
-def getNodes(self):
+    def getNodes(self):
         return self.nodes
 
-def get_outgoing_edges(self, node):
+    def get_outgoing_edges(self, node):
         if node in self.nodes:
             return self.nodes[node]["connections"]
         return []
 
-
-def value(self, from_node, to_node):
+    def value(self, from_node, to_node):
         edge = (min(from_node, to_node), max(from_node, to_node))
         return self.edges.get(edge, float('inf'))
 
-def dijkstra(Graph, start_node):
-    unvisited_nodes = list(Graph.getNodes().keys())
-    shortest_path = {}
+def dijkstra(graph, start_node, end_node=None):
+    """
+    İkili yığın (heapq) tabanlı Dijkstra.
+    Kuyruktan çıkan eski kayıtlar tembel silme ile atlanır. end_node verilirse
+    hedef kesinleştiği anda arama durur; verilmezse tüm bileşen taranır.
+    shortest_path yalnızca ulaşılan düğümleri içerir.
+    """
+    shortest_path = {start_node: 0}
     previous_nodes = {}
-    max_value = sys.maxsize
-
-    for node in unvisited_nodes:
-        shortest_path[node] = max_value
-    shortest_path[start_node] = 0
-
-    while unvisited_nodes:
-        current_min_node = None
-        for node in unvisited_nodes:
-            if current_min_node is None or shortest_path[node] < shortest_path[current_min_node]:
-                current_min_node = node
-
-        neighbors = Graph.get_outgoing_edges(current_min_node)
-        for neighbor in neighbors:
-            temp_value = shortest_path[current_min_node] + Graph.value(current_min_node, neighbor)
-            if temp_value < shortest_path[neighbor]:
-                shortest_path[neighbor] = temp_value
-                previous_nodes[neighbor] = current_min_node
+    visited = set()
+    heap = [(0, start_node)]
+
+    while heap:
+        current_distance, current_node = heapq.heappop(heap)
+        if current_node in visited:
+            continue
+        visited.add(current_node)
+        if current_node == end_node:
+            break
 
-        unvisited_nodes.remove(current_min_node)
+        for neighbor in graph.get_outgoing_edges(current_node):
+            if neighbor in visited:
+                continue
+            temp_value = current_distance + graph.value(current_node, neighbor)
+            if temp_value < shortest_path.get(neighbor, sys.maxsize):
+                shortest_path[neighbor] = temp_value
+                previous_nodes[neighbor] = current_node
+                heapq.heappush(heap, (temp_value, neighbor))
 
     return previous_nodes, shortest_path
 
-def create_priority_queue_manual(graph, start_id):
+def create_priority_queue_manual(graph, start_id, weight="papers", on_event=None):
     """
     A yazarı ve işbirliği yaptığı yazarlar için düğüm ağırlıklarına göre kuyruk oluşturur.
-    Ağırlık, her bir yazarın toplam işbirliği sayısını ifade eder.
-    Kuyruk elle sıralanır (Python listesi kullanılarak).
+    Ağırlık varsayılan olarak yazarın makale sayısıdır (weight="degree" ile bağlantı sayısı).
+    Kuyruk ikili yığın üzerinde kurulur ve büyük ağırlıktan küçüğe boşaltılır;
+    ekleme/çıkarma adımları on_event'e tek tek bildirilir.
     """
     if start_id not in graph.getNodes():
         print(f"No such ORCID {start_id} exists in the graph.")
         return []
 
-    
+    queue = build_collaborator_queue(graph, start_id, weight, on_event)
     priority_queue = []
-    visited = set()
-
-    # A yazarını kuyruğa ekle
-    start_connections = len(graph.getNodes()[start_id]["connections"])
-    priority_queue.append((start_connections, start_id))
-    visited.add(start_id)
-
-    # A yazarı ile işbirliği yapanları kuyruğa ekle
-    for neighbor in graph.get_outgoing_edges(start_id):
-        if neighbor not in visited:
-            neighbor_connections = len(graph.getNodes()[neighbor]["connections"])
-            priority_queue.append((neighbor_connections, neighbor))
-            visited.add(neighbor)
-
-    
-    for i in range(len(priority_queue)):
-        for j in range(i + 1, len(priority_queue)):
-            if priority_queue[i][0] < priority_queue[j][0]:  # Büyük ağırlık önce gelmeli
-                priority_queue[i], priority_queue[j] = priority_queue[j], priority_queue[i]
+    while queue:
+        author_id, author_weight = queue.dequeue()
+        priority_queue.append((author_weight, author_id))
 
     return priority_queue
 
-def print_priority_queue_manual(priority_queue, graph):
+def print_priority_queue_manual(priority_queue, graph, weight="papers"):
     """
     Kuyruğu ekrana yazdırır.
     """
+    label = "Makale Sayısı" if weight == "papers" else "İşbirliği Sayısı"
     print("\nPriority Queue (Yazarlar ve Ağırlıkları):")
-    for weight, author_id in priority_queue:
+    for author_weight, author_id in priority_queue:
         author_name = graph.getNodes()[author_id]["name"]
-        print(f"Yazar: {author_name} (ORCID: {author_id}), İşbirliği Sayısı: {weight}")
+        print(f"Yazar: {author_name} (ORCID: {author_id}), {label}: {author_weight}")
 
 
 def find_shortest_path(graph, start_id, end_id):
-    previous_nodes, shortest_path = dijkstra(graph, start_id)
+    if start_id != end_id and not graph.isConnected(start_id, end_id):
+        return None, float('inf')
+    previous_nodes, shortest_path = dijkstra(graph, start_id, end_id)
     path = []
     current_node = end_id
     while current_node != start_id:
@@ -198,145 +290,284 @@ def find_shortest_path(graph, start_id, end_id):
     path.reverse()
     return path, shortest_path[end_id]
 
-def find_max_connection(graph):
-    max_connections = 0 
-    most_connected_author = None 
-
-    for orcid , node_data in graph.getNodes().items() : 
-        connection_count = len (node_data["connections"]) 
-        if connection_count > max_connections : 
-            max_connections = connection_count 
-            most_connected_author = orcid 
-    return most_connected_author, max_connections         
+def build_incoming_edges(graph):
+    """
+    Her düğüm için kendisine bağlantı veren düğümlerin listesini çıkarır.
+    clean_connections bir bağlantıyı yalnızca bir taraftan sildiği için
+    "connections" listeleri her zaman simetrik değildir.
+    """
+    incoming = {orcid: [] for orcid in graph.getNodes()}
+    for orcid, node_data in graph.getNodes().items():
+        for conn in node_data["connections"]:
+            incoming[conn].append(orcid)
+    return incoming
 
-def find_connection_count(graph, countId) :
-    for orcid , node_data in graph.getNodes().items() : 
-        if orcid == countId : 
-            count_connection = len (node_data["connections"])
-            return count_connection
-    return None      
-
-def find_longest_path(graph, start_node):
-    visited = set()  
-    longest_path = []  
-    def dfs(current_node, path):
-        nonlocal longest_path
-        visited.add(current_node)
+def find_shortest_path_bidirectional(graph, start_id, end_id, incoming=None):
+    """
+    A ve B'den aynı anda ilerleyen çift yönlü Dijkstra.
+    İki yığının en küçük değerlerinin toplamı bulunan en iyi buluşma
+    mesafesini geçtiğinde durur; bu noktada yolun en kısa olduğu kesindir.
+    find_shortest_path ile aynı (path, distance) çiftini döndürür.
+
+    Geri yön arama gelen bağlantıları izler. Çok sayıda sorgu yapılacaksa
+    build_incoming_edges bir kez çağrılıp sonucu incoming olarak verilmelidir.
+    """
+    if start_id not in graph.getNodes() or end_id not in graph.getNodes():
+        return None, float('inf')
+    if start_id == end_id:
+        return [start_id], 0
+    if not graph.isConnected(start_id, end_id):
+        return None, float('inf')
+    if incoming is None:
+        incoming = build_incoming_edges(graph)
+    neighbors_of = (graph.get_outgoing_edges, incoming.__getitem__)
+
+    distances = ({start_id: 0}, {end_id: 0})
+    parents = ({}, {})
+    settled = (set(), set())
+    heaps = ([(0, start_id)], [(0, end_id)])
+    best_distance = float('inf')
+    meeting_node = None
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best_distance:
+            break
+
+        # Küçük olan sınırı genişlet
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        current_distance, current_node = heapq.heappop(heaps[side])
+        if current_node in settled[side]:
+            continue
+        settled[side].add(current_node)
+
+        for neighbor in neighbors_of[side](current_node):
+            temp_value = current_distance + graph.value(current_node, neighbor)
+            if temp_value < distances[side].get(neighbor, sys.maxsize):
+                distances[side][neighbor] = temp_value
+                parents[side][neighbor] = current_node
+                heapq.heappush(heaps[side], (temp_value, neighbor))
+            if neighbor in distances[1 - side]:
+                total = distances[side][neighbor] + distances[1 - side][neighbor]
+                if total < best_distance:
+                    best_distance = total
+                    meeting_node = neighbor
+
+    if meeting_node is None:
+        return None, float('inf')
+
+    path = []
+    current_node = meeting_node
+    while current_node is not None:
         path.append(current_node)
-       
+        current_node = parents[0].get(current_node)
+    path.reverse()
+    current_node = parents[1].get(meeting_node)
+    while current_node is not None:
+        path.append(current_node)
+        current_node = parents[1].get(current_node)
+    return path, best_distance
 
-        if len(path) > len(longest_path):
-            longest_path = path[:]
-        
-        for neighbor in graph.get_outgoing_edges(current_node):
-            if neighbor not in visited:
-                dfs(neighbor, path)
-        
-        path.pop()
-        visited.remove(current_node)
-    dfs(start_node, [])
-    return longest_path
-file_path = 'data/dataset.xlsx'
-data = pd.read_excel(file_path)
-
-
-author_papers = {}
-for _, row in data.iterrows():
-    if pd.notna(row["orcid"]) and pd.notna(row["paper_title"]):
-        orcid = row["orcid"].lower()
-        if orcid not in author_papers:
-            author_papers[orcid] = []
-        if row["paper_title"] not in author_papers[orcid]: 
-            author_papers[orcid].append(row["paper_title"])
-unique_authors = data[["author_name", "orcid", "paper_title"]].dropna().drop_duplicates()
-author_id_map = {row.orcid.lower(): row.author_name.lower() for _, row in unique_authors.iterrows()}
-
-all_coauthors = set()
-for coauthor_list in data["coauthors"].apply(parse_coauthors):
-    all_coauthors.update(coauthor_list)
-
-existing_authors = set(author_id_map.values())
-missing_coauthors = all_coauthors - existing_authors
-
-def generate_deterministic_id(author_name):
-    total = 0
-    for i, char in enumerate(author_name):
-        total += (i + 1) * ord(char) 
-    return f"generated-{total % 1000000}"  
-
-for coauthor in missing_coauthors:
-    deterministic_id = generate_deterministic_id(coauthor) 
-    author_id_map[deterministic_id] = coauthor
-
-authorGraph = Graph()
-for orcid, author_name in author_id_map.items():
-    authorGraph.addNode(orcid, author_name)
-    if orcid in author_papers:
-        for paper in author_papers[orcid]:
-            authorGraph.addPaper(orcid, paper)
-
-data["author_orcid"] = data["orcid"].str.lower()
-data["coauthors"] = data["coauthors"].apply(parse_coauthors)
-
-for _, row in data.iterrows():
-    coauthors = row["coauthors"]
-    for coauthor in coauthors:
-        coauthor_orcid = next((k for k, v in author_id_map.items() if v == coauthor), None)
-        if coauthor_orcid:
-            authorGraph.addEdges(row["author_orcid"], coauthor_orcid)
-
-clean_connections(authorGraph, data)
-
-authorGraph.writeJsonManual("cleaned_graph_output.json")
-print("Bağlantılardan yazarın kendi ismiyle eşleşenler temizlendi ve güncellenmiş JSON dosyasına yazıldı: cleaned_graph_output.json")
-
-
-authorGraph.writeJsonManual("graph_output.json")
-print("Graf JSON dosyasına yazdırıldı: graph_output.json")
-
-start_orcid = input("Enter the start ORCID: ")
-end_orcid = input("Enter the end ORCID: ")
-
-path, distance = find_shortest_path(authorGraph, start_orcid, end_orcid)
-if path is None:
-    print(f"\n\nThere is no path between {start_orcid} and {end_orcid}")
-else:
-    print(f"\n\nShortest path: {path}")
-    print(f"\nTotal distance: {distance}")
-
-most_connected_author, max_connections = find_max_connection(authorGraph)
-author_name = authorGraph.getNodes()[most_connected_author]["name"]
-
-print(f"Most connected author: {author_name} (ORCID: {most_connected_author})")
-print(f"Number of connections: {max_connections}")
-
-countId = input("Type the ID for which you want to calculate the number of connections :")
-count_connection = find_connection_count(authorGraph,countId)
-if count_connection is None : 
-    print ("Count id has no connections")
-    print(f"Count id number of connections is : {count_connection}")
-start_id = input("Enter the ORCID to find the longest path: ")
-if start_id in authorGraph.getNodes():
-    longest_path = find_longest_path(authorGraph, start_id)
-    print(f"\nLongest path from {start_id}: {longest_path}")
-    print(f"Number of nodes in the longest path: {len(longest_path)}")
-else:
-    print(f"Count id number of connections is : {count_connection}")
-    print(f"No such ORCID {start_id} exists in the graph.")
+def find_max_connection(graph):
+    top = graph.topAuthors(1)
+    if not top or top[0][1] == 0:
+        return None, 0
+    most_connected_author, max_connections = top[0]
+    return most_connected_author, max_connections         
 
-   
-author_id = input("dugum olusturmak icin ORCID id giriniz: ")
-if author_id in authorGraph.getNodes():
-    priority_queue = create_priority_queue_manual(authorGraph, author_id)
-    print_priority_queue_manual(priority_queue, authorGraph)
-else:
-    print(f"No such ORCID {author_id} exists in the graph.")
+def find_connection_count(graph, countId) :
+    return graph.getDegree(countId)
 
+def find_longest_path(graph, start_node, time_limit=DEFAULT_TIME_LIMIT, node_budget=None):
+    """
+    Başlangıç düğümünden izlenebilecek en uzun basit yolu döndürür.
+    Arama longest_path.find_longest_path_bounded ile yapılır: küçük
+    bileşenlerde kesin bitmask DP, büyüklerde sezgisel + budamalı arama.
+    time_limit (saniye, varsayılan 5) ya da node_budget dolarsa o ana kadarki
+    en uzun yol döner.
+    """
+    return find_longest_path_bounded(graph, start_node, time_limit, node_budget, beam_width=32).path
 
-author_id = input("dugum olusturmak icin ORCID id giriniz: ")
-if author_id in authorGraph.getNodes():
-    priority_queue = create_priority_queue_manual(authorGraph, author_id)
-    print_priority_queue_manual(priority_queue, authorGraph)
-else:
-    print(f"No such ORCID {author_id} exists in the graph")
+def build_graph(data, timings=None, allocator=None, indexed=True):
+    """
+    Veri setinden yazar grafını satır satır dolaşmadan (iterrows kullanmadan) kurar.
+    Ortak yazar sütunu explode edilir, isimler isim -> ORCID sözlüğüyle çözülür
+    ve kenar ağırlıkları groupby ile toplu hesaplanır.
+    ORCID'i olmayan ortak yazarların kimlikleri allocator'dan (IdAllocator) alınır.
+    timings sözlüğü verilirse her aşamanın süresi (saniye) içine yazılır.
+    indexed, Graph'ın bağlantı/makale depolamasını seçer (bkz. Graph).
+    """
+    if timings is None:
+        timings = {}
+    if allocator is None:
+        allocator = IdAllocator()
+    started = phase_started = time.perf_counter()
+
+    def mark(phase):
+        nonlocal phase_started
+        now = time.perf_counter()
+        timings[phase] = now - phase_started
+        phase_started = now
+
+    papers = data[["orcid", "paper_title"]].dropna()
+    papers = papers.assign(orcid=papers["orcid"].str.lower()).drop_duplicates()
+    author_papers = papers.groupby("orcid", sort=False)["paper_title"].agg(list).to_dict()
+
+    unique_authors = data[["author_name", "orcid", "paper_title"]].dropna().drop_duplicates()
+    author_id_map = dict(zip(unique_authors["orcid"].str.lower(), unique_authors["author_name"].str.lower()))
+
+    # Çağıranın DataFrame'i değiştirilmez; ayrıştırılmış sütunlar yerel tutulur
+    author_rows = pd.DataFrame({
+        "author_orcid": data["orcid"].str.lower(),
+        "coauthors": data["coauthors"].apply(parse_coauthors),
+    })
+
+    all_coauthors = set()
+    for coauthor_list in author_rows["coauthors"]:
+        all_coauthors.update(coauthor_list)
+    missing_coauthors = all_coauthors - set(author_id_map.values())
+
+    # Yeni isimlerin yoklama sırası çalıştırmadan bağımsız olsun diye sıralanır
+    for coauthor in sorted(missing_coauthors):
+        author_id_map[allocator.allocate(coauthor)] = coauthor
+    mark("authors")
+
+    authorGraph = Graph(indexed)
+    for orcid, author_name in author_id_map.items():
+        authorGraph.addNode(orcid, author_name)
+    for orcid, paper_list in author_papers.items():
+        if orcid in authorGraph.nodes:
+            authorGraph.nodes[orcid]["papers"] = authorGraph.collection(paper_list)
+    mark("nodes")
+
+    # İsim -> ORCID: aynı isim birden çok anahtarda varsa ilk anahtar kullanılır
+    name_to_orcid = {}
+    for orcid, author_name in author_id_map.items():
+        name_to_orcid.setdefault(author_name, orcid)
+    names = pd.Series({orcid: node_data["name"] for orcid, node_data in authorGraph.nodes.items()}, dtype=object)
+
+    pairs = author_rows.explode("coauthors").dropna()
+    pairs = pairs.merge(
+        pd.DataFrame({"coauthors": list(name_to_orcid.keys()), "coauthor_orcid": list(name_to_orcid.values())}),
+        on="coauthors", how="inner", sort=False
+    )
+    pairs = pairs[pairs["author_orcid"].isin(names.index) & (pairs["author_orcid"] != pairs["coauthor_orcid"])]
+    pairs = pairs[pairs["author_orcid"].map(names).values != pairs["coauthor_orcid"].map(names).values]
+    orcid_1 = pairs["author_orcid"].to_numpy(dtype=object)
+    orcid_2 = pairs["coauthor_orcid"].to_numpy(dtype=object)
+    pairs = pairs.assign(
+        edge_low=np.where(orcid_1 < orcid_2, orcid_1, orcid_2),
+        edge_high=np.where(orcid_1 < orcid_2, orcid_2, orcid_1)
+    )
+    edge_table = pairs.groupby(["edge_low", "edge_high"], sort=False).agg(
+        orcid_1=("author_orcid", "first"),
+        orcid_2=("coauthor_orcid", "first"),
+        weight=("author_orcid", "size")
+    )
+    mark("edges")
+
+    for (edge_low, edge_high), orcid_1, orcid_2, weight in zip(
+        edge_table.index, edge_table["orcid_1"], edge_table["orcid_2"], edge_table["weight"]
+    ):
+        authorGraph.edges[(edge_low, edge_high)] = int(weight)
+        authorGraph.nodes[orcid_1]["connections"].append(orcid_2)
+        authorGraph.nodes[orcid_2]["connections"].append(orcid_1)
+        authorGraph.components.union(orcid_1, orcid_2)
+    for orcid in authorGraph.nodes:
+        authorGraph.refreshDegree(orcid)
+
+    clean_connections(authorGraph, data)
+    mark("connections")
+    timings["total"] = time.perf_counter() - started
+    return authorGraph
+
+def load_graph(file_path='data/dataset.xlsx', id_file='data/generated_ids.json', merge_duplicates=None):
+    """
+    merge_duplicates: None (birleştirme yok), "exact" ya da "initials".
+    Verildiğinde aynı kişiye ait görünen isimler ve ORCID'ler kenarlar
+    kurulmadan önce name_index.merge_duplicate_authors ile birleştirilir.
+    """
+    data = read_dataset(file_path)
+    ingested = read_ingested_rows(file_path)
+    if ingested is not None:
+        # incremental ile sonradan eklenen satırlar veri setinin devamı sayılır
+        data = pd.concat([data, ingested], ignore_index=True)
+    if merge_duplicates:
+        # name_index, parse_coauthors için bu modülü içe aktarıyor
+        from name_index import merge_duplicate_authors
+        data = merge_duplicate_authors(data, merge_duplicates)
+    timings = {}
+    allocator = IdAllocator(id_file)
+    authorGraph = build_graph(data, timings, allocator)
+    allocator.save()
+    print(f"Graf {timings['total'] * 1000:.1f} ms içinde oluşturuldu "
+          f"({len(authorGraph.nodes)} düğüm, {len(authorGraph.edges)} kenar)")
+    return authorGraph, data
+
+def main():
+    authorGraph, data = load_graph()
+
+    authorGraph.writeJsonManual(["cleaned_graph_output.json", "graph_output.json"])
+    print("Bağlantılardan yazarın kendi ismiyle eşleşenler temizlendi ve güncellenmiş JSON dosyasına yazıldı: cleaned_graph_output.json")
+    print("Graf JSON dosyasına yazdırıldı: graph_output.json")
+
+    write_snapshot(authorGraph, "graph_snapshot.bin")
+
+    start_orcid = input("Enter the start ORCID: ")
+    end_orcid = input("Enter the end ORCID: ")
+
+    path, distance = find_shortest_path(authorGraph, start_orcid, end_orcid)
+    if path is None:
+        print(f"\n\nThere is no path between {start_orcid} and {end_orcid}")
+    else:
+        print(f"\n\nShortest path: {path}")
+        print(f"\nTotal distance: {distance}")
+
+    most_connected_author, max_connections = find_max_connection(authorGraph)
+    author_name = authorGraph.getNodes()[most_connected_author]["name"]
+
+    print(f"Most connected author: {author_name} (ORCID: {most_connected_author})")
+    print(f"Number of connections: {max_connections}")
+
+    countId = input("Type the ID for which you want to calculate the number of connections :")
+    count_connection = find_connection_count(authorGraph,countId)
+    if count_connection is None : 
+        print ("Count id has no connections")
+        print(f"Count id number of connections is : {count_connection}")
+    start_id = input("Enter the ORCID to find the longest path: ")
+    if start_id in authorGraph.getNodes():
+        result = find_longest_path_bounded(authorGraph, start_id, time_limit=10, beam_width=32)
+        longest_path = result.path
+        print(f"\nLongest path from {start_id}: {longest_path}")
+        print(f"Number of nodes in the longest path: {len(longest_path)}")
+        if not result.optimal:
+            print("Time limit reached; this is the longest path found so far.")
+    else:
+        print(f"Count id number of connections is : {count_connection}")
+        print(f"No such ORCID {start_id} exists in the graph.")
 
+   
+    author_id = input("dugum olusturmak icin ORCID id giriniz: ")
+    if author_id in authorGraph.getNodes():
+        priority_queue = create_priority_queue_manual(authorGraph, author_id)
+        print_priority_queue_manual(priority_queue, authorGraph)
+
+        author_tree = AuthorTree.from_queue(authorGraph, priority_queue)
+        delete_id = input("Agactan silinecek yazarin ORCID id'sini giriniz: ")
+        if not author_tree.delete(delete_id):
+            print(f"No such ORCID {delete_id} exists in the tree.")
+        print("\nBST (seviye sırasıyla):")
+        for level, (weight, orcid), name in author_tree.level_order():
+            print(f"{'  ' * level}{name} (ORCID: {orcid}, Makale Sayısı: {weight})")
+    else:
+        print(f"No such ORCID {author_id} exists in the graph.")
+
+
+    author_id = input("dugum olusturmak icin ORCID id giriniz: ")
+    if author_id in authorGraph.getNodes():
+        priority_queue = create_priority_queue_manual(authorGraph, author_id)
+        print_priority_queue_manual(priority_queue, authorGraph)
+    else:
+        print(f"No such ORCID {author_id} exists in the graph")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+import re
+import unicodedata
+from collections import defaultdict
+
+import pandas as pd
+
+from main import parse_coauthors
+
+
+def canonical_name(name):
+    """
+    Karşılaştırma için ismin kanonik biçimi: küçük harf, aksan ve noktalama
+    yok, tek boşluk. "B. Rajakumar" ve "b rajakumar" aynı anahtarı verir.
+    """
+    name = unicodedata.normalize("NFKD", str(name)).encode("ascii", "ignore").decode("ascii")
+    name = re.sub(r"[^a-z0-9 ]+", " ", name.lower())
+    return " ".join(name.split())
+
+
+def name_parts(canonical):
+    """
+    (soyad, ad parçaları). "rajakumar s" gibi baş harfin sonda yazıldığı
+    biçimde soyad ilk parçadır, diğer durumlarda son parça.
+    """
+    tokens = canonical.split()
+    if len(tokens) <= 1:
+        return canonical, ()
+    if len(tokens[-1]) == 1 and len(tokens[0]) > 1:
+        return tokens[0], tuple(tokens[1:])
+    return tokens[-1], tuple(tokens[:-1])
+
+
+def compatible(given_a, given_b):
+    """Ad parçaları birebir aynı ya da biri diğerinin baş harfi ise uyumludur."""
+    if len(given_a) != len(given_b):
+        return False
+    for a, b in zip(given_a, given_b):
+        if a == b:
+            continue
+        if (len(a) == 1 or len(b) == 1) and a[0] == b[0]:
+            continue
+        return False
+    return True
+
+
+class NameIndex:
+    """
+    İsimleri soyada göre bloklara ayıran indeks. Tekrar eden yazar adayları
+    yalnızca aynı blok içinde karşılaştırılır; tüm isim çiftlerine bakılmaz.
+    """
+
+    def __init__(self):
+        self.order = {}
+        self.canonical = {}
+        self.by_canonical = defaultdict(list)
+        self.blocks = defaultdict(set)
+
+    def add(self, name):
+        if name in self.canonical:
+            return
+        key = canonical_name(name)
+        self.order[name] = len(self.order)
+        self.canonical[name] = key
+        self.by_canonical[key].append(name)
+        self.blocks[name_parts(key)[0]].add(key)
+
+    def candidates(self, name):
+        """Aynı soyad bloğundaki diğer isimler."""
+        key = self.canonical.get(name) or canonical_name(name)
+        return [
+            other for other_key in self.blocks.get(name_parts(key)[0], ())
+            for other in self.by_canonical[other_key] if other != name
+        ]
+
+    def groups(self, mode="exact"):
+        """
+        İsim -> temsilci isim eşlemesi. "exact": kanonik biçimi aynı olanlar
+        birleşir. "initials": ayrıca baş harfleri uyumlu olanlar birleşir;
+        ancak bir kısa biçim birbiriyle uyumsuz iki uzun biçime uyuyorsa
+        (ör. "r kumar" -> "rajesh kumar" / "ravi kumar") o grup birleştirilmez.
+        Temsilci, grupta indekse ilk eklenen isimdir.
+        """
+        parent = {key: key for key in self.by_canonical}
+
+        def find(key):
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        if mode == "initials":
+            for block in self.blocks.values():
+                keys = sorted(block)
+                parts = {key: name_parts(key)[1] for key in keys}
+                for i, key_a in enumerate(keys):
+                    for key_b in keys[i + 1:]:
+                        if compatible(parts[key_a], parts[key_b]):
+                            parent[find(key_a)] = find(key_b)
+
+                members = defaultdict(list)
+                for key in keys:
+                    members[find(key)].append(key)
+                for group in members.values():
+                    ambiguous = any(
+                        not compatible(parts[key_a], parts[key_b])
+                        for i, key_a in enumerate(group) for key_b in group[i + 1:]
+                    )
+                    if ambiguous:
+                        for key in group:
+                            parent[key] = key
+        elif mode != "exact":
+            raise ValueError(f"Unknown merge mode: {mode}")
+
+        representative = {}
+        for key, names in self.by_canonical.items():
+            root = find(key)
+            first = min(names, key=self.order.__getitem__)
+            if root not in representative or self.order[first] < self.order[representative[root]]:
+                representative[root] = first
+        return {
+            name: representative[find(key)]
+            for key, names in self.by_canonical.items() for name in names
+        }
+
+
+def merge_duplicate_authors(data, mode="exact"):
+    """
+    Kenarlar kurulmadan önce aynı kişiye ait görünen isimleri ve ORCID'leri
+    birleştirir. author_name, orcid ve coauthors sütunları temsilci isim ve
+    ORCID ile yeniden yazılmış bir DataFrame kopyası döner.
+
+    İki farklı ORCID yalnızca isim benzerliğiyle birleşmez: aynı isim
+    grubundaki ORCID'lerin ortak bir makalesi ya da grup dışından ortak bir
+    ortak yazarı olmalıdır. ORCID'siz ortak yazar isimleri, grubunda tek bir
+    ORCID kümesi varsa ona bağlanır; birden çok küme varsa olduğu gibi kalır.
+    """
+    data = data.copy()
+    author_names = data["author_name"].str.strip().str.lower()
+    orcids = data["orcid"].str.lower()
+    coauthor_lists = data["coauthors"].apply(parse_coauthors)
+
+    index = NameIndex()
+    for name in author_names.dropna():
+        index.add(name)
+    for coauthor_list in coauthor_lists:
+        for name in coauthor_list:
+            index.add(name)
+    name_map = index.groups(mode)
+
+    # Her ORCID ilk görüldüğü ismin grubuna aittir
+    first_name = {}
+    group_orcids = defaultdict(list)
+    for orcid, name in zip(orcids, author_names):
+        if pd.isna(orcid) or pd.isna(name) or orcid in first_name:
+            continue
+        first_name[orcid] = name
+        group_orcids[name_map[name]].append(orcid)
+
+    def same_person(name_a, name_b):
+        surname_a, given_a = name_parts(index.canonical[name_a])
+        surname_b, given_b = name_parts(index.canonical[name_b])
+        return surname_a == surname_b and (
+            not given_a or not given_b or given_a[0][0] == given_b[0][0]
+        )
+
+    # Kanıt: makale (DOI ya da başlık) ve tek bir ORCID'e çözülen ortak yazar.
+    # ORCID'siz ("anil kumar") ya da birden çok ORCID'e ait ortak yazar isimleri
+    # ile kişinin kendi isminin biçimleri ("r. kumar") kimseyi ayırt etmez
+    evidence = defaultdict(set)
+    dois = data["doi"] if "doi" in data else pd.Series(pd.NA, index=data.index)
+    for orcid, doi, title, coauthors in zip(orcids, dois, data["paper_title"], coauthor_lists):
+        if orcid not in first_name:
+            continue
+        if not pd.isna(doi):
+            evidence[orcid].add(("doi", str(doi).strip().lower()))
+        if not pd.isna(title):
+            evidence[orcid].add(("paper", canonical_name(title)))
+        evidence[orcid].update(
+            ("coauthor", name_map[coauthor]) for coauthor in coauthors
+            if not same_person(coauthor, first_name[orcid])
+            and len(group_orcids.get(name_map[coauthor], ())) == 1
+        )
+
+    # Temsilci ORCID, kümede ilk görülen ORCID'dir
+    parent = {orcid: orcid for orcid in first_name}
+    order = {orcid: position for position, orcid in enumerate(first_name)}
+
+    def find(orcid):
+        while parent[orcid] != orcid:
+            parent[orcid] = parent[parent[orcid]]
+            orcid = parent[orcid]
+        return orcid
+
+    for members in group_orcids.values():
+        seen = {}
+        for orcid in members:
+            for item in evidence[orcid]:
+                other = seen.setdefault(item, orcid)
+                root_a, root_b = find(orcid), find(other)
+                if root_a != root_b:
+                    root_a, root_b = sorted((root_a, root_b), key=order.__getitem__)
+                    parent[root_b] = root_a
+
+    clusters = {
+        group: {find(orcid) for orcid in members}
+        for group, members in group_orcids.items()
+    }
+    orcid_map = {orcid: find(orcid) for orcid in first_name}
+
+    def resolved_name(name):
+        # Grupta en fazla bir ORCID kümesi varsa temsilci isim; yoksa belirsizdir
+        group = name_map[name]
+        return group if len(clusters.get(group, ())) <= 1 else name
+
+    def author_name(orcid, name):
+        if pd.isna(name) or pd.isna(orcid):
+            return name if pd.isna(name) else resolved_name(name)
+        root = orcid_map[orcid]
+        return resolved_name(first_name[root])
+
+    data["author_name"] = [author_name(orcid, name) for orcid, name in zip(orcids, author_names)]
+    data["orcid"] = orcids.map(lambda orcid: orcid_map.get(orcid, orcid))
+    data["coauthors"] = coauthor_lists.map(
+        lambda names: "[" + ",".join(f"'{resolved_name(name)}'" for name in names) + "]"
+    )
+    return data
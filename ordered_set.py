@@ -0,0 +1,54 @@
+class OrderedSet:
+    """
+    Ekleme sırasını koruyan küme (dict anahtarları üzerine kurulu).
+    Üyelik testi, ekleme ve silme O(1)'dir; okuma tarafında liste gibi
+    davranır (iterasyon, len, indeksleme, listeyle karşılaştırma), böylece
+    bağlantı ve makale listelerini okuyan kod değişmeden çalışır.
+    append, aynı öğe ikinci kez eklendiğinde hiçbir şey yapmaz.
+    """
+
+    __slots__ = ("items",)
+
+    def __init__(self, iterable=()):
+        self.items = dict.fromkeys(iterable)
+
+    def __contains__(self, item):
+        return item in self.items
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __reversed__(self):
+        return reversed(self.items)
+
+    def __getitem__(self, index):
+        # Sıralı erişim nadir kullanılır; liste gibi O(n)
+        return list(self.items)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, OrderedSet):
+            return list(self.items) == list(other.items)
+        if isinstance(other, list):
+            return list(self.items) == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"OrderedSet({list(self.items)!r})"
+
+    def add(self, item):
+        self.items[item] = None
+
+    append = add
+
+    def extend(self, iterable):
+        for item in iterable:
+            self.items[item] = None
+
+    def discard(self, item):
+        self.items.pop(item, None)
+
+    def remove(self, item):
+        del self.items[item]
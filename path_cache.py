@@ -0,0 +1,180 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from main import dijkstra, build_incoming_edges
+
+
+class _IncomingView:
+    """Dijkstra'nın gelen bağlantılar üzerinde çalışması için grafın ters görünümü."""
+
+    def __init__(self, graph, incoming):
+        self.graph = graph
+        self.incoming = incoming
+
+    def get_outgoing_edges(self, node):
+        return self.incoming.get(node, [])
+
+    def value(self, from_node, to_node):
+        return self.graph.value(from_node, to_node)
+
+
+class ShortestPathCache:
+    """
+    Kaynak düğüm başına en kısa yol ağacı önbelleği (LRU, en fazla max_trees ağaç).
+    Ağaçlar düğüm indeksi üzerinde int dizileri olarak saklanır: previous (-1: yok)
+    ve distance (-1: ulaşılamaz). Graf addNode/addEdges/clean_connections ile
+    değiştiğinde (graph.version) önbellek tümüyle boşaltılır.
+
+    A -> B sorgusunda A'nın ileri ağacı ya da B'nin ters ağacı (B'ye gelen
+    yollar) önbellekteyse yeni arama yapılmaz. clean_connections bağlantıları
+    tek taraftan silebildiği için B'nin ileri ağacı (ve A'nın ters ağacı)
+    yalnızca bileşende tek taraflı bağlantı yoksa kullanılır; o zaman her
+    yol iki yönde de aynı uzunluktadır ve B -> A yolu ters çevrilerek
+    A -> B en kısa yolu elde edilir.
+    """
+
+    def __init__(self, graph, max_trees=64):
+        self.graph = graph
+        self.max_trees = max_trees
+        self.trees = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._reset()
+
+    def _reset(self):
+        self.trees.clear()
+        self.version = self.graph.version
+        self.orcids = list(self.graph.getNodes().keys())
+        self.index = {orcid: i for i, orcid in enumerate(self.orcids)}
+        self._incoming = None
+        self._asymmetric = None
+
+    def _check_version(self):
+        if self.graph.version != self.version:
+            self._reset()
+
+    def invalidate(self):
+        self._reset()
+
+    def _symmetric(self, orcid):
+        """orcid'in bileşenindeki her bağlantı iki taraflıysa True."""
+        if self._asymmetric is None:
+            nodes = self.graph.getNodes()
+            self._asymmetric = {
+                self.graph.getComponent(orcid)
+                for orcid, node_data in nodes.items()
+                for conn in node_data["connections"]
+                if orcid not in nodes[conn]["connections"]
+            }
+        return self.graph.getComponent(orcid) not in self._asymmetric
+
+    def _build_tree(self, source, reverse):
+        if reverse:
+            if self._incoming is None:
+                self._incoming = build_incoming_edges(self.graph)
+            previous_nodes, shortest_path = dijkstra(_IncomingView(self.graph, self._incoming), source)
+        else:
+            previous_nodes, shortest_path = dijkstra(self.graph, source)
+
+        previous = np.full(len(self.orcids), -1, dtype=np.int32)
+        distance = np.full(len(self.orcids), -1, dtype=np.int64)
+        for node, node_distance in shortest_path.items():
+            distance[self.index[node]] = node_distance
+        for node, parent in previous_nodes.items():
+            previous[self.index[node]] = self.index[parent]
+        return previous, distance
+
+    def _insert(self, key, tree):
+        self.trees[key] = tree
+        if len(self.trees) > self.max_trees:
+            self.trees.popitem(last=False)
+
+    def tree(self, source, reverse=False):
+        """source için (previous, distance) dizilerini döndürür; gerekirse hesaplar."""
+        self._check_version()
+        key = (source, reverse)
+        if key in self.trees:
+            self.trees.move_to_end(key)
+            return self.trees[key]
+        tree = self._build_tree(source, reverse)
+        self._insert(key, tree)
+        return tree
+
+    def build(self, source):
+        """
+        source'un ileri ağacını önbelleğe yazmadan kurar. Önbelleği değiştirmediği
+        için paylaşılan kilit dışında çağrılabilir; sonuç store ile eklenir.
+        """
+        self._check_version()
+        return self.version, source, self._build_tree(source, False)
+
+    def store(self, built):
+        """build sonucunu önbelleğe ekler; graf arada değiştiyse ağaç atılır."""
+        version, source, tree = built
+        self._check_version()
+        if version == self.version:
+            self._insert((source, False), tree)
+
+    def _walk(self, tree, start, end):
+        previous, distance = tree
+        if distance[end] < 0:
+            return None, float('inf')
+        path = [end]
+        while path[-1] != start:
+            path.append(int(previous[path[-1]]))
+        return path, int(distance[end])
+
+    def lookup(self, start_id, end_id):
+        """
+        Sorgu önbellekteki bir ağaçla ya da hiç ağaç kurmadan yanıtlanabiliyorsa
+        (path, distance), yeni ağaç gerekiyorsa None döndürür (kaçırma sayılır).
+        """
+        self._check_version()
+        if start_id not in self.index or end_id not in self.index:
+            return None, float('inf')
+        if start_id != end_id and not self.graph.isConnected(start_id, end_id):
+            # Farklı bileşenler: ağaç kurmadan reddedilir, önbelleğe dokunulmaz
+            return None, float('inf')
+        start = self.index[start_id]
+        end = self.index[end_id]
+
+        if (start_id, False) in self.trees:
+            path, distance = self._walk(self.tree(start_id), start, end)
+            if path is not None:
+                path.reverse()
+        elif (end_id, True) in self.trees:
+            path, distance = self._walk(self.tree(end_id, reverse=True), end, start)
+        elif (end_id, False) in self.trees and self._symmetric(start_id):
+            path, distance = self._walk(self.tree(end_id), end, start)
+        elif (start_id, True) in self.trees and self._symmetric(start_id):
+            path, distance = self._walk(self.tree(start_id, reverse=True), start, end)
+            if path is not None:
+                path.reverse()
+        else:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._result(path, distance)
+
+    def resolve(self, built, end_id):
+        """build ile kurulan ağaçtan kaynağı -> end_id yolunu çıkarır."""
+        _, source, tree = built
+        path, distance = self._walk(tree, self.index[source], self.index[end_id])
+        if path is not None:
+            path.reverse()
+        return self._result(path, distance)
+
+    def _result(self, path, distance):
+        if path is None:
+            return None, float('inf')
+        return [self.orcids[node] for node in path], distance
+
+    def find_shortest_path(self, start_id, end_id):
+        """main.find_shortest_path ile aynı (path, distance) çiftini döndürür."""
+        result = self.lookup(start_id, end_id)
+        if result is None:
+            built = self.build(start_id)
+            self.store(built)
+            result = self.resolve(built, end_id)
+        return result
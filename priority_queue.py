@@ -0,0 +1,114 @@
+class CollaboratorQueue:
+    """
+    İndeksli ikili yığın (max-heap). En büyük ağırlıklı yazar önce çıkar;
+    eşit ağırlıkta önce eklenen önce çıkar. Her yazarın yığındaki konumu
+    tutulduğu için ağırlık güncellemesi (increase/decrease-key) O(log n)'dir.
+
+    Her işlem events listesine (işlem, orcid, ağırlık, kuyruk boyu) olarak
+    eklenir ve varsa on_event ile anında bildirilir; kuyruğun tam kopyası
+    hiçbir adımda saklanmaz.
+    """
+
+    def __init__(self, on_event=None):
+        self.heap = []
+        self.position = {}
+        self.events = []
+        self.on_event = on_event
+        self.counter = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, orcid):
+        return orcid in self.position
+
+    def _emit(self, action, orcid, weight):
+        event = (action, orcid, weight, len(self.heap))
+        self.events.append(event)
+        if self.on_event is not None:
+            self.on_event(event)
+
+    def _higher(self, i, j):
+        # (ağırlık büyük, sıra küçük) olan önce gelir
+        weight_i, order_i, _ = self.heap[i]
+        weight_j, order_j, _ = self.heap[j]
+        return weight_i > weight_j or (weight_i == weight_j and order_i < order_j)
+
+    def _swap(self, i, j):
+        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+        self.position[self.heap[i][2]] = i
+        self.position[self.heap[j][2]] = j
+
+    def _sift_up(self, i):
+        while i > 0:
+            parent = (i - 1) // 2
+            if not self._higher(i, parent):
+                break
+            self._swap(i, parent)
+            i = parent
+
+    def _sift_down(self, i):
+        size = len(self.heap)
+        while True:
+            best = i
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < size and self._higher(child, best):
+                    best = child
+            if best == i:
+                break
+            self._swap(i, best)
+            i = best
+
+    def enqueue(self, orcid, weight):
+        if orcid in self.position:
+            self.update(orcid, weight)
+            return
+        self.heap.append([weight, self.counter, orcid])
+        self.counter += 1
+        self.position[orcid] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+        self._emit("enqueue", orcid, weight)
+
+    def update(self, orcid, weight):
+        i = self.position[orcid]
+        old_weight = self.heap[i][0]
+        self.heap[i][0] = weight
+        if weight > old_weight:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+        self._emit("update", orcid, weight)
+
+    def peek(self):
+        weight, _, orcid = self.heap[0]
+        return orcid, weight
+
+    def dequeue(self):
+        weight, _, orcid = self.heap[0]
+        last = self.heap.pop()
+        del self.position[orcid]
+        if self.heap:
+            self.heap[0] = last
+            self.position[last[2]] = 0
+            self._sift_down(0)
+        self._emit("dequeue", orcid, weight)
+        return orcid, weight
+
+
+def collaborator_weight(graph, orcid, weight="papers"):
+    """Düğüm ağırlığı: "papers" için makale sayısı, "degree" için bağlantı sayısı."""
+    if weight == "papers":
+        return len(graph.getNodes()[orcid]["papers"])
+    if weight == "degree":
+        return graph.getDegree(orcid)
+    raise ValueError(f"Unknown queue weight: {weight}")
+
+
+def build_collaborator_queue(graph, start_id, weight="papers", on_event=None):
+    """A yazarını ve işbirliği yaptığı yazarları ağırlıklarıyla kuyruğa ekler."""
+    queue = CollaboratorQueue(on_event)
+    queue.enqueue(start_id, collaborator_weight(graph, start_id, weight))
+    for neighbor in graph.get_outgoing_edges(start_id):
+        if neighbor not in queue:
+            queue.enqueue(neighbor, collaborator_weight(graph, neighbor, weight))
+    return queue